@@ -3,11 +3,6 @@ Streamlit Dashboard - Main Entry Point
 """
 
 import streamlit as st
-from pathlib import Path
-import sys
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 st.set_page_config(
     page_title="Solana ML Scanner",
@@ -16,6 +11,22 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+@st.cache_data(ttl=30)
+def _load_metrics() -> dict:
+    """
+    Load headline metrics, memoized for 30s across reruns
+    
+    Every widget interaction reruns this script top to bottom, so data
+    reads belong here rather than inline in main().
+    """
+    # Placeholder values until the database exposes trade statistics
+    return {
+        'capital': ("€100.00", "0%"),
+        'win_rate': ("0%", "0%"),
+        'alerts_today': ("0", None),
+        'ml_accuracy': ("60%", "Baseline"),
+    }
+
 def main():
     """Main dashboard page"""
     
@@ -24,20 +35,20 @@ def main():
     
     st.info("🚧 Dashboard is under construction. Check back soon!")
     
-    # Placeholder metrics
+    metrics = _load_metrics()
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("Capital", "€100.00", "0%")
+        st.metric("Capital", *metrics['capital'])
     
     with col2:
-        st.metric("Win Rate", "0%", "0%")
+        st.metric("Win Rate", *metrics['win_rate'])
     
     with col3:
-        st.metric("Alerts Today", "0")
+        st.metric("Alerts Today", *metrics['alerts_today'])
     
     with col4:
-        st.metric("ML Accuracy", "60%", "Baseline")
+        st.metric("ML Accuracy", *metrics['ml_accuracy'])
     
     st.markdown("---")
     st.info("ℹ️  Full dashboard will be available in the next update!")
@@ -3,14 +3,11 @@
 Solana ML Scanner - Main Entry Point
 """
 
+import argparse
 import asyncio
 import sys
-from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
-from src.core.orchestrator import Orchestrator
+from src.utils.helpers import banner_enabled, install_event_loop
 from src.utils.logger import setup_logger
 
 def print_banner():
@@ -23,9 +20,30 @@ def print_banner():
     """
     print(banner)
 
-async def main():
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(
+        description="Solana ML Scanner - Smart Memecoin Opportunity Detection"
+    )
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        help="Skip the startup banner (also set via SCANNER_QUIET)"
+    )
+    parser.add_argument(
+        "--no-uvloop",
+        action="store_true",
+        help="Run on the stock asyncio event loop (for debugging)"
+    )
+    return parser.parse_args(argv)
+
+async def main(quiet: bool = False):
     """Main function"""
-    print_banner()
+    # Imported here so --help does not pay for loading the analyzer/ML stack
+    from src.core.orchestrator import Orchestrator
+    
+    if banner_enabled(quiet):
+        print_banner()
     
     # Setup logger
     logger = setup_logger()
@@ -33,7 +51,7 @@ async def main():
     
     try:
         # Initialize orchestrator
-        orchestrator = Orchestrator()
+        orchestrator = await Orchestrator.create()
         
         # Start bot
         await orchestrator.start()
@@ -44,5 +62,11 @@ async def main():
         logger.error(f"Fatal error: {e}", exc_info=True)
         sys.exit(1)
 
+def run():
+    """Console entry point"""
+    args = parse_args()
+    install_event_loop(enabled=not args.no_uvloop)
+    asyncio.run(main(quiet=args.quiet))
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    run()
@@ -5,38 +5,65 @@ Improves prediction accuracy from 60% → 85%+
 """
 
 import os
-import pickle
-import requests
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from src.utils.helpers import banner_enabled
+
+# lz4 gives fast decompression on bot startup; fall back to zlib without it
+try:
+    import lz4  # noqa: F401
+    MODEL_COMPRESSION = ('lz4', 3)
+except ImportError:
+    MODEL_COMPRESSION = 3
+
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+# Repository root (scripts/..) and model output directory
+ROOT = Path(__file__).resolve().parent.parent
+MODELS_DIR = ROOT / "models"
 
 # Model URLs and checksums (placeholder - will be replaced with actual URLs)
 MODELS = {
     "pump_predictor.pkl": {
         "url": "https://github.com/Azeflow10/solana-ml-models/releases/download/v1.0/pump_predictor.pkl",
         "description": "Predicts if a token will pump (85% accuracy)",
-        "size_mb": 2.3
+        "size_mb": 2.3,
+        "sha256": None
     },
     "magnitude_estimator.pkl": {
         "url": "https://github.com/Azeflow10/solana-ml-models/releases/download/v1.0/magnitude_estimator.pkl",
         "description": "Estimates pump magnitude in % (78% accuracy)",
-        "size_mb": 1.8
+        "size_mb": 1.8,
+        "sha256": None
     },
     "rug_detector.pkl": {
         "url": "https://github.com/Azeflow10/solana-ml-models/releases/download/v1.0/rug_detector.pkl",
         "description": "Detects rug pulls and scams (92% accuracy)",
-        "size_mb": 2.1
+        "size_mb": 2.1,
+        "sha256": None
     },
     "pattern_matcher.pkl": {
         "url": "https://github.com/Azeflow10/solana-ml-models/releases/download/v1.0/pattern_matcher.pkl",
         "description": "Recognizes pump patterns (80% accuracy)",
-        "size_mb": 3.5
+        "size_mb": 3.5,
+        "sha256": None
     }
 }
 
-def download_file(url: str, destination: Path) -> bool:
-    """Download a file from URL to destination"""
+def download_file(url: str, destination: Path, expected_sha256: Optional[str] = None) -> bool:
+    """
+    Download a file from URL to destination
+    
+    The SHA-256 digest is computed while streaming, so no second pass over
+    the file is needed. If expected_sha256 is given and does not match, the
+    file is removed and the download reported as failed.
+    """
+    import requests
+    
     try:
         print(f"📥 Downloading {destination.name}...")
         response = requests.get(url, stream=True, timeout=120)
@@ -44,16 +71,26 @@ def download_file(url: str, destination: Path) -> bool:
         
         total_size = int(response.headers.get('content-length', 0))
         downloaded = 0
+        last_mb = -1
+        digest = hashlib.sha256()
         
         with open(destination, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                 if chunk:
                     f.write(chunk)
+                    digest.update(chunk)
                     downloaded += len(chunk)
-                    if total_size > 0:
+                    # Only redraw progress once per MiB
+                    if total_size > 0 and (downloaded >> 20) != last_mb:
+                        last_mb = downloaded >> 20
                         progress = (downloaded / total_size) * 100
                         print(f"   Progress: {progress:.1f}%", end='\r')
         
+        if expected_sha256 and digest.hexdigest() != expected_sha256:
+            destination.unlink(missing_ok=True)
+            print(f"   ❌ Checksum mismatch for {destination.name}")
+            return False
+        
         print(f"   ✅ Downloaded {destination.name}           ")
         return True
         
@@ -61,58 +98,71 @@ def download_file(url: str, destination: Path) -> bool:
         print(f"   ❌ Failed to download {destination.name}: {e}")
         return False
 
-def create_mock_model(path: Path, model_type: str):
+def create_mock_model(path: Path, model_type: str, n_jobs: int = -1):
     """Create a mock model for development/testing"""
     from sklearn.ensemble import RandomForestClassifier
     from sklearn.linear_model import LinearRegression
+    import joblib
     import numpy as np
     
     print(f"🔨 Creating mock model: {path.name}")
     
+    # Seeded PCG64 generator; float32 is what sklearn trees use internally
+    rng = np.random.default_rng(42)
+    X = rng.random((100, 10), dtype=np.float32)
+    
     # Create appropriate mock model based on type
     if "predictor" in model_type or "detector" in model_type:
-        model = RandomForestClassifier(n_estimators=100, random_state=42)
-        # Fit with dummy data
-        X = np.random.rand(100, 10)
-        y = np.random.randint(0, 2, 100)
-        model.fit(X, y)
+        model = RandomForestClassifier(n_estimators=100, random_state=42, n_jobs=n_jobs)
+        y = rng.integers(0, 2, 100, dtype=np.int8)
     elif "estimator" in model_type:
         model = LinearRegression()
-        X = np.random.rand(100, 10)
-        y = np.random.rand(100)
-        model.fit(X, y)
+        y = rng.random(100, dtype=np.float32)
     elif "matcher" in model_type:
-        model = RandomForestClassifier(n_estimators=50, random_state=42)
-        X = np.random.rand(100, 10)
-        y = np.random.randint(0, 5, 100)  # 5 pattern classes
-        model.fit(X, y)
+        model = RandomForestClassifier(n_estimators=50, random_state=42, n_jobs=n_jobs)
+        y = rng.integers(0, 5, 100, dtype=np.int8)  # 5 pattern classes
     else:
-        model = RandomForestClassifier(n_estimators=100, random_state=42)
-        X = np.random.rand(100, 10)
-        y = np.random.randint(0, 2, 100)
-        model.fit(X, y)
+        model = RandomForestClassifier(n_estimators=100, random_state=42, n_jobs=n_jobs)
+        y = rng.integers(0, 2, 100, dtype=np.int8)
+    
+    # Fit with dummy data; MLPredictor refuses models marked as mocks
+    model.fit(X, y)
+    model.is_mock = True
     
     # Save model
-    with open(path, 'wb') as f:
-        pickle.dump(model, f)
+    joblib.dump(model, path, compress=MODEL_COMPRESSION)
     
     print(f"   ✅ Mock model created: {path.name}")
 
 def verify_model(path: Path) -> bool:
     """Verify a model can be loaded"""
+    import joblib
+    
     try:
-        with open(path, 'rb') as f:
-            model = pickle.load(f)
+        model = joblib.load(path)
         print(f"   ✅ Verified: {path.name}")
         return True
     except Exception as e:
         print(f"   ❌ Failed to verify {path.name}: {e}")
         return False
 
+def _build_one(item: Tuple[str, Dict[str, Any]], models_dir: Path, n_jobs: int) -> Tuple[str, bool]:
+    """Create and verify one mock model (runs in a worker process)"""
+    model_name, _ = item
+    destination = models_dir / model_name
+    
+    try:
+        create_mock_model(destination, model_name, n_jobs=n_jobs)
+        return model_name, verify_model(destination)
+    except Exception as e:
+        print(f"❌ Failed to create mock model {model_name}: {e}")
+        return model_name, False
+
 def main():
     """Main download function"""
     
-    print("""
+    if banner_enabled():
+        print("""
     ╔═══════════════════════════════════════════════╗
     ║     📦 ML MODELS DOWNLOADER                  ║
     ║     Download Pre-trained Models              ║
@@ -120,9 +170,8 @@ def main():
     """)
     
     # Get models directory
-    root = Path(__file__).parent.parent
-    models_dir = root / "models"
-    models_dir.mkdir(exist_ok=True)
+    models_dir = MODELS_DIR
+    models_dir.mkdir(parents=True, exist_ok=True)
     
     print(f"📁 Models directory: {models_dir}")
     print(f"📊 Models to download: {len(MODELS)}")
@@ -136,7 +185,7 @@ def main():
         print("⚠️  scikit-learn not installed. Cannot create mock models.")
         mock_available = False
     
-    # Download each model
+    # List the models to install
     success_count = 0
     for model_name, model_info in MODELS.items():
         print(f"\n{'='*50}")
@@ -144,24 +193,26 @@ def main():
         print(f"Description: {model_info['description']}")
         print(f"Size: {model_info['size_mb']} MB")
         print(f"{'='*50}")
+    
+    # Try to download from URL
+    # NOTE: URLs are placeholders - in production, these would point to actual model files
+    # For now, we'll create mock models for development
+    
+    print("\n⚠️  Remote models not available yet. Creating mock models for development...")
+    
+    if mock_available:
+        # Fit the models in parallel, splitting cores between them so the
+        # per-forest n_jobs does not oversubscribe the machine
+        cpu_count = os.cpu_count() or 1
+        n_jobs = max(1, cpu_count // len(MODELS))
+        build = partial(_build_one, models_dir=models_dir, n_jobs=n_jobs)
         
-        destination = models_dir / model_name
-        
-        # Try to download from URL
-        # NOTE: URLs are placeholders - in production, these would point to actual model files
-        # For now, we'll create mock models for development
-        
-        print("⚠️  Remote models not available yet. Creating mock model for development...")
+        with ProcessPoolExecutor(max_workers=min(len(MODELS), cpu_count)) as executor:
+            results = list(executor.map(build, MODELS.items()))
         
-        if mock_available:
-            try:
-                create_mock_model(destination, model_name)
-                if verify_model(destination):
-                    success_count += 1
-            except Exception as e:
-                print(f"❌ Failed to create mock model: {e}")
-        else:
-            print("❌ Cannot create mock model without scikit-learn")
+        success_count = sum(ok for _, ok in results)
+    else:
+        print("❌ Cannot create mock models without scikit-learn")
     
     # Summary
     print(f"\n{'='*50}")
@@ -171,12 +222,9 @@ def main():
     
     if success_count == len(MODELS):
         print("\n🎉 All models installed successfully!")
-        print("\n📝 Next steps:")
-        print("   1. Restart the bot: python main.py")
-        print("   2. The bot will now use ML-enhanced predictions")
-        print("   3. Accuracy improved: 60% → 85%+")
         print("\n💡 The models are mock versions for development.")
-        print("   In production, download real pre-trained models.")
+        print("   The bot ignores them and keeps rule-based scoring;")
+        print("   install real pre-trained models to enable ML scoring.")
     else:
         print("\n⚠️  Some models failed to install")
         print("   The bot will still work with rule-based predictions (60% accuracy)")
@@ -4,15 +4,17 @@ Database Setup Script
 Creates database schema and prepares for pre-trained models
 """
 
-import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
+from src.analyzers import holder_analyzer, liquidity_analyzer
 from src.database.db_manager import DatabaseManager
+from src.scoring import scoring_engine
 from src.utils.logger import setup_logger
 
+# Working directories are resolved relative to where the bot is launched
+ROOT = Path.cwd()
+DIRECTORIES = ("data", "models", "logs")
+
 def main():
     """Setup database and initial data"""
     logger = setup_logger()
@@ -21,26 +23,34 @@ def main():
     print("=" * 50)
     
     # Create necessary directories
-    print("\n[1/5] Creating directories...")
-    directories = ['data', 'models', 'logs']
-    for dir_name in directories:
-        Path(dir_name).mkdir(exist_ok=True)
+    print("\n[1/6] Creating directories...")
+    for dir_name in DIRECTORIES:
+        (ROOT / dir_name).mkdir(parents=True, exist_ok=True)
         print(f"✅ {dir_name}/ created")
     
     # Create database
-    print("\n[2/5] Creating database...")
+    print("\n[2/6] Creating database...")
     db = DatabaseManager()
     print("✅ Database created: data/scanner.db")
     
-    print("\n[3/5] Creating tables...")
+    print("\n[3/6] Creating tables...")
     db.create_tables()
     print("✅ Tables created successfully")
     
-    print("\n[4/5] Pre-trained models...")
+    print("\n[4/6] Pre-trained models...")
     print("ℹ️  Models will be downloaded when you run download_pretrained_models.py")
     print("ℹ️  Or the bot will train its own models from scratch")
     
-    print("\n[5/5] Configuration...")
+    print("\n[5/6] Warming JIT cache...")
+    scoring_engine.warm_up()
+    holder_analyzer.warm_up()
+    liquidity_analyzer.warm_up()
+    if scoring_engine.NUMBA_AVAILABLE:
+        print("✅ Scoring kernels compiled and cached")
+    else:
+        print("ℹ️  numba not installed, using pure-Python scoring")
+    
+    print("\n[6/6] Configuration...")
     print("✅ Configuration templates ready")
     
     print("\n" + "=" * 50)
@@ -48,8 +58,8 @@ def main():
     print("\n📚 Next steps:")
     print("1. Copy .env.example to .env and add your API keys")
     print("2. Copy config.yaml.example to config.yaml")
-    print("3. (Optional) Run: python scripts/download_pretrained_models.py")
-    print("4. Run: python main.py")
+    print("3. (Optional) Run: solana-download-models")
+    print("4. Run: solana-scanner")
     print("=" * 50 + "\n")
 
 if __name__ == "__main__":
@@ -1,30 +1,55 @@
 #!/usr/bin/env python3
 """Test scanner functionality"""
 
-import sys
-import os
+import argparse
 import asyncio
-from pathlib import Path
+import operator
+import time
 
-# Add project root to Python path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+from src.utils.helpers import install_event_loop
+from src.utils.validators import is_valid_address
 
-# Now imports will work
-from src.scanners.dexscreener_scanner import DexScreenerScanner
-from src.analyzers.rugcheck_analyzer import RugCheckAnalyzer
-from src.analyzers.liquidity_analyzer import LiquidityAnalyzer
-from src.analyzers.holder_analyzer import HolderAnalyzer
-from src.scoring.scoring_engine import ScoringEngine
-from src.pattern_detection.pattern_detector import PatternDetector
-from src.models.token_data import TokenData
+DEFAULT_TOKEN_ADDRESS = "So11111111111111111111111111111111111111112"  # Wrapped SOL
 
-async def main():
+# Throwaway token used to warm connections; must differ from the test token
+# so the timed run does not hit the analyzers' per-address cache
+WARMUP_TOKEN_ADDRESS = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"  # USDC
+
+# DexScreener token_info keys with their defaults, and the TokenData fields
+# they fill (same order)
+_TOKEN_INFO_DEFAULTS = {
+    'symbol': 'SOL',
+    'name': 'Wrapped SOL',
+    'liquidity': 0,
+    'market_cap': 0,
+    'price': 0,
+    'volume_24h': 0,
+    'holders': 0,
+    'age_seconds': 0,
+}
+_TOKEN_FIELDS = (
+    'symbol', 'name', 'liquidity_usd', 'market_cap',
+    'price_usd', 'volume_24h', 'holders', 'age_seconds'
+)
+_get_token_info = operator.itemgetter(*_TOKEN_INFO_DEFAULTS)
+
+async def run_tests(session: "aiohttp.ClientSession", test_token_address: str):
+    # Heavy imports (numpy, numba, aiohttp) are deferred so --help stays instant
+    from src.scanners.dexscreener_scanner import DexScreenerScanner
+    from src.analyzers.rugcheck_analyzer import RugCheckAnalyzer
+    from src.analyzers.liquidity_analyzer import LiquidityAnalyzer
+    from src.analyzers import holder_analyzer, liquidity_analyzer
+    from src.analyzers.holder_analyzer import HolderAnalyzer
+    from src.scoring import scoring_engine
+    from src.scoring.scoring_engine import ScoringEngine
+    from src.pattern_detection.pattern_detector import PatternDetector
+    from src.models.token_data import TokenData
+    
     print("🔍 Scanner & Analyzer Test")
     print("=" * 60)
     
-    # Test with a known token (e.g., popular Solana token)
-    test_token_address = "So11111111111111111111111111111111111111112"  # Wrapped SOL
+    if not is_valid_address(test_token_address):
+        raise ValueError(f"Invalid token address: {test_token_address}")
     
     print(f"\n📍 Testing with token: {test_token_address}")
     print()
@@ -37,9 +62,9 @@ async def main():
     }
     
     dex_scanner = DexScreenerScanner(config)
-    rugcheck = RugCheckAnalyzer(config)
-    liquidity = LiquidityAnalyzer(config)
-    holder = HolderAnalyzer(config)
+    rugcheck = RugCheckAnalyzer(config, session=session)
+    liquidity = LiquidityAnalyzer(config, session=session)
+    holder = HolderAnalyzer(config, session=session)
     scoring = ScoringEngine(config)
     pattern = PatternDetector()  # Note: PatternDetector uses no config by design
     
@@ -55,59 +80,81 @@ async def main():
         print("❌ Failed to get token info")
     print()
     
-    # Test RugCheck
-    print("🔒 Step 2: Running RugCheck analysis...")
-    try:
-        rugcheck_result = await rugcheck.analyze(test_token_address)
-        if rugcheck_result:
-            print(f"✅ RugCheck score: {rugcheck_result.overall_score}/10")
-        else:
-            print("⚠️  RugCheck analysis failed (may be rate limited)")
-    except Exception as e:
-        print(f"⚠️  RugCheck analysis failed: {e}")
-        rugcheck_result = None
+    # Pay one-time costs (DNS, TLS handshakes, JIT compile) outside the
+    # timed region so the reported time is steady-state
+    print("🔥 Warming up connections...")
+    scoring_engine.warm_up()
+    holder_analyzer.warm_up()
+    liquidity_analyzer.warm_up()
+    await asyncio.gather(
+        rugcheck.analyze(WARMUP_TOKEN_ADDRESS),
+        liquidity.analyze(WARMUP_TOKEN_ADDRESS),
+        holder.analyze(WARMUP_TOKEN_ADDRESS),
+        return_exceptions=True
+    )
     print()
     
-    # Test Liquidity Analysis
-    print("💧 Step 3: Analyzing liquidity...")
-    try:
-        liquidity_result = await liquidity.analyze(test_token_address)
-        if liquidity_result:
-            print(f"✅ Liquidity: ${liquidity_result.total_liquidity_usd:,.0f}")
-        else:
-            print("⚠️  Liquidity analysis failed")
-    except Exception as e:
-        print(f"⚠️  Liquidity analysis failed: {e}")
-        liquidity_result = None
+    # Run RugCheck, liquidity and holder analysis concurrently - they are
+    # independent network calls, so wall time is the slowest one, not the sum
+    print("🔒 Steps 2-4: Running RugCheck, liquidity and holder analysis...")
+    start_ns = time.perf_counter_ns()
+    rugcheck_result, liquidity_result, holder_result = await asyncio.gather(
+        rugcheck.analyze(test_token_address),
+        liquidity.analyze(test_token_address),
+        holder.analyze(test_token_address),
+        return_exceptions=True
+    )
+    elapsed = (time.perf_counter_ns() - start_ns) / 1e9
+    print(f"⏱️  Analyzers completed in {elapsed:.2f}s (steady-state)")
     print()
     
-    # Test Holder Analysis
-    print("👥 Step 4: Analyzing holders...")
-    try:
-        holder_result = await holder.analyze(test_token_address)
-        if holder_result:
-            print(f"✅ Holders: {holder_result.total_holders}")
-        else:
-            print("⚠️  Holder analysis failed")
-    except Exception as e:
-        print(f"⚠️  Holder analysis failed: {e}")
+    # Build the analyzer report and write it in one go rather than one
+    # stdout write per line
+    report = []
+    
+    # Report RugCheck
+    report.append("🔒 Step 2: RugCheck analysis")
+    if isinstance(rugcheck_result, Exception):
+        report.append(f"⚠️  RugCheck analysis failed: {rugcheck_result}")
+        rugcheck_result = None
+    elif rugcheck_result:
+        report.append(f"✅ RugCheck score: {rugcheck_result.overall_score}/10")
+    else:
+        report.append("⚠️  RugCheck analysis failed (may be rate limited)")
+    report.append("")
+    
+    # Report Liquidity Analysis
+    report.append("💧 Step 3: Liquidity analysis")
+    if isinstance(liquidity_result, Exception):
+        report.append(f"⚠️  Liquidity analysis failed: {liquidity_result}")
+        liquidity_result = None
+    elif liquidity_result:
+        report.append(f"✅ Liquidity: ${liquidity_result.total_liquidity_usd:,.0f}")
+    else:
+        report.append("⚠️  Liquidity analysis failed")
+    report.append("")
+    
+    # Report Holder Analysis
+    report.append("👥 Step 4: Holder analysis")
+    if isinstance(holder_result, Exception):
+        report.append(f"⚠️  Holder analysis failed: {holder_result}")
         holder_result = None
-    print()
+    elif holder_result:
+        report.append(f"✅ Holders: {holder_result.total_holders}")
+    else:
+        report.append("⚠️  Holder analysis failed")
+    report.append("")
+    
+    print("\n".join(report))
     
     # Create a TokenData object for scoring
     print("🎯 Step 5: Calculating scores...")
     if token_info:
+        token_values = _get_token_info({**_TOKEN_INFO_DEFAULTS, **token_info})
         token_data = TokenData(
             address=test_token_address,
-            symbol=token_info.get('symbol', 'SOL'),
-            name=token_info.get('name', 'Wrapped SOL'),
-            liquidity_usd=token_info.get('liquidity', 0),
-            market_cap=token_info.get('market_cap', 0),
-            price_usd=token_info.get('price', 0),
-            volume_24h=token_info.get('volume_24h', 0),
-            holders=token_info.get('holders', 0),
-            age_seconds=token_info.get('age_seconds', 0),
-            source='dexscreener'
+            source='dexscreener',
+            **dict(zip(_TOKEN_FIELDS, token_values))
         )
         
         scores = scoring.calculate_score(
@@ -116,10 +163,11 @@ async def main():
             liquidity=liquidity_result,
             holders=holder_result
         )
-        print(f"✅ Combined Score: {scores.score_combined:.0f}/100")
-        print(f"   ├─ Rule Score: {scores.score_rules:.0f}/100")
-        print(f"   └─ ML Score: {scores.score_ml:.0f}/100")
-        print()
+        print(
+            f"✅ Combined Score: {scores.score_combined:.0f}/100\n"
+            f"   ├─ Rule Score: {scores.score_rules:.0f}/100\n"
+            f"   └─ ML Score: {scores.score_ml:.0f}/100\n"
+        )
         
         # Detect pattern
         print("🔍 Step 6: Detecting pattern...")
@@ -135,8 +183,32 @@ async def main():
         print("⚠️  Skipping scoring and pattern detection (no token info)")
         print()
     
+    await holder.close()
+    
     print("=" * 60)
     print("🎉 Test complete!")
 
+async def main(test_token_address: str = DEFAULT_TOKEN_ADDRESS):
+    import aiohttp
+    
+    # One pooled session shared by all analyzers so repeated requests reuse
+    # TCP/TLS connections instead of opening a new client per call
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300),
+        timeout=aiohttp.ClientTimeout(total=10, connect=3)
+    )
+    try:
+        await run_tests(session, test_token_address)
+    finally:
+        await session.close()
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Run the scanner and analyzers against one token")
+    parser.add_argument(
+        "--token",
+        default=DEFAULT_TOKEN_ADDRESS,
+        help="Token address to analyze (default: Wrapped SOL)"
+    )
+    args = parser.parse_args()
+    install_event_loop()
+    asyncio.run(main(args.token))
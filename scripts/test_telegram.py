@@ -6,15 +6,11 @@ Verifies connectivity, message sending, and button functionality
 
 import sys
 import asyncio
-from pathlib import Path
-
-# Add project root to path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
 
 from src.core.config import Config
 from src.notifications.telegram_bot import TelegramBot
 from src.notifications.formatter import MessageFormatter
+from src.utils.helpers import install_event_loop
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -281,4 +277,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_event_loop()
     asyncio.run(main())
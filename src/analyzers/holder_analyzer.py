@@ -4,26 +4,117 @@ Holder Analyzer - Analyzes token holder distribution
 
 import aiohttp
 import asyncio
-from typing import Dict, Any, Optional
+import numpy as np
+from typing import Dict, Any, List, Optional, Tuple
+from src.utils.cache import TTLCache
+from src.utils.dex_batch import DexScreenerBatch
+from src.utils.http import client_timeout
+from src.utils.jit import njit, prange
 from src.utils.logger import get_logger
+from src.utils.shared_cache import get_dex
 from src.models.token_data import HolderResult
 
 logger = get_logger(__name__)
 
+# Distribution score buckets: points[i] applies between thresholds[i-1] and
+# thresholds[i]
+# Number of holders, 40 points (more is better, thresholds inclusive below)
+_HOLDER_THRESHOLDS = np.array([20, 50, 100, 200, 500, 1000])
+_HOLDER_POINTS = np.array([0.0, 10.0, 20.0, 25.0, 30.0, 35.0, 40.0])
+# Top 10 concentration %, 40 points (lower is better, thresholds inclusive above)
+_TOP10_THRESHOLDS = np.array([20.0, 30.0, 40.0, 50.0])
+_TOP10_POINTS = np.array([40.0, 30.0, 20.0, 10.0, 0.0])
+# Dev wallet %, 20 points (lower is better, thresholds inclusive above)
+_DEV_THRESHOLDS = np.array([5.0, 10.0, 15.0, 20.0])
+_DEV_POINTS = np.array([20.0, 15.0, 10.0, 5.0, 0.0])
+
+# The weights never change at runtime, so the final score for every
+# (holder, top10, dev) bucket combination is materialized once (7x5x5)
+_DISTRIBUTION_TABLE = np.minimum(
+    100.0,
+    _HOLDER_POINTS[:, None, None] + _TOP10_POINTS[None, :, None] + _DEV_POINTS[None, None, :]
+)
+
+# Returned when analysis fails; results are frozen, so one instance is shared
+_EMPTY_HOLDER_RESULT = HolderResult(
+    total_holders=0,
+    top_10_concentration=100.0,
+    distribution_score=0.0
+)
+
+
+@njit(cache=True)
+def _score_distribution_scalar(
+    total_holders: int,
+    top_10_concentration: float,
+    dev_wallet_percent: float
+) -> float:
+    """
+    Holder distribution score (0-100), compiled with numba when available
+    
+    Each input is bucketed with a sorted-threshold search and the score is
+    read from the precomputed table.
+    """
+    
+    return _DISTRIBUTION_TABLE[
+        np.searchsorted(_HOLDER_THRESHOLDS, total_holders, side='right'),
+        np.searchsorted(_TOP10_THRESHOLDS, top_10_concentration, side='left'),
+        np.searchsorted(_DEV_THRESHOLDS, dev_wallet_percent, side='left')
+    ]
+
+
+@njit(cache=True, parallel=True)
+def _score_distribution_vec(total_holders, top_10_concentration, dev_wallet_percent, out):
+    """Score a batch of tokens into out, one array element per token"""
+    for i in prange(total_holders.shape[0]):
+        out[i] = _score_distribution_scalar(
+            total_holders[i],
+            top_10_concentration[i],
+            dev_wallet_percent[i]
+        )
+    return out
+
+
+def warm_up():
+    """Compile the distribution kernels ahead of the first real scan"""
+    _score_distribution_scalar(100, 30.0, 5.0)
+    _score_distribution_vec(
+        np.array([100], dtype=np.int64),
+        np.array([30.0]),
+        np.array([5.0]),
+        np.empty(1)
+    )
+
 
 class HolderAnalyzer:
     """Analyzes token holder distribution"""
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    FAILED_RESULT = _EMPTY_HOLDER_RESULT  # Returned when analysis fails
+    
+    def __init__(
+        self,
+        config: Optional[Dict[str, Any]] = None,
+        session: Optional[aiohttp.ClientSession] = None
+    ):
         """Initialize holder analyzer"""
         self.config = config or {}
+        self.session = session  # Shared session, owned by the caller
         self.timeout = self.config.get('timeout', 10)
-        self.cache = {}
+        self._session: Optional[aiohttp.ClientSession] = None  # Lazily created, owned by us
         self.cache_ttl = 30
+        self.cache = TTLCache(maxsize=self.config.get('cache_max', 10000), ttl=self.cache_ttl)
+        self.dex_batch = DexScreenerBatch(timeout=self.timeout, cache_ttl=self.cache_ttl)
+        self._inflight: Dict[str, asyncio.Future] = {}  # Analyses currently running, by cache key
         
         logger.info("Holder Analyzer initialized")
     
-    async def analyze(self, token_address: str, token_data: Optional[Dict[str, Any]] = None) -> HolderResult:
+    async def analyze(
+        self,
+        token_address: str,
+        token_data: Optional[Dict[str, Any]] = None,
+        force: bool = False,
+        dex_data: Optional[Dict[str, Any]] = None
+    ) -> HolderResult:
         """
         Analyze holder distribution
         
@@ -33,44 +124,189 @@ class HolderAnalyzer:
         - Dev wallet %
         - Growth rate
         - Distribution score
+        
+        Pass dex_data (a pre-fetched DexScreener response, e.g. from
+        DexScreenerBatch) to skip the per-token lookup.
         """
         
-        try:
-            # Check cache
-            cache_key = f"holders_{token_address}"
-            if cache_key in self.cache:
-                cached_data, cached_time = self.cache[cache_key]
-                if (asyncio.get_event_loop().time() - cached_time) < self.cache_ttl:
-                    logger.debug(f"Using cached holder data for {token_address}")
-                    return cached_data
+        # Check cache (force=True always refetches)
+        cache_key = f"holders_{token_address}"
+        if not force:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.debug("Using cached holder data for %s", token_address)
+                return cached
             
+            # Join an identical analysis that is already running rather than
+            # repeating it for every concurrent caller
+            pending = self._inflight.get(cache_key)
+            if pending is not None:
+                return await asyncio.shield(pending)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            result = await self._analyze_uncached(token_address, token_data, dex_data)
+            future.set_result(result)
+            return result
+        finally:
+            if not future.done():
+                future.cancel()
+            if self._inflight.get(cache_key) is future:
+                del self._inflight[cache_key]
+    
+    async def _analyze_uncached(
+        self,
+        token_address: str,
+        token_data: Optional[Dict[str, Any]] = None,
+        dex_data: Optional[Dict[str, Any]] = None
+    ) -> HolderResult:
+        """Run the analysis and cache the result"""
+        
+        try:
             # Fetch holder data
             # Note: This would typically come from Helius RPC or similar
             # For now, we'll use data from token_data or DexScreener
-            result = await self._analyze_holders(token_address, token_data)
+            result = await self._analyze_holders(token_address, token_data, dex_data)
             
             # Cache the result
-            self.cache[cache_key] = (result, asyncio.get_event_loop().time())
+            self.cache[f"holders_{token_address}"] = result
             
-            logger.info(f"Holder analysis complete for {token_address}: {result.total_holders} holders")
+            logger.info("Holder analysis complete for %s: %d holders", token_address, result.total_holders)
             return result
             
         except Exception as e:
-            logger.error(f"Holder analysis failed for {token_address}: {e}")
+            logger.error("Holder analysis failed for %s: %s", token_address, e)
             # Return defaults on error
-            return HolderResult(
-                total_holders=0,
-                top_10_concentration=100.0,
-                distribution_score=0.0
+            return _EMPTY_HOLDER_RESULT
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, or a pooled one owned by this analyzer"""
+        if self.session is not None:
+            return self.session
+        
+        # Keep one keep-alive connection pool for all analyze() calls instead
+        # of paying a TCP+TLS handshake per token
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300, keepalive_timeout=60),
+                timeout=client_timeout(self.timeout)
             )
+        return self._session
+    
+    async def close(self):
+        """Close the session this analyzer created (a shared one is left open)"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def analyze_many(
+        self,
+        addresses: List[str],
+        token_data_map: Optional[Dict[str, Dict[str, Any]]] = None,
+        force: bool = False
+    ) -> Dict[str, HolderResult]:
+        """
+        Analyze holder distribution for many tokens at once
+        
+        Cache misses are resolved with batched DexScreener requests and scored
+        in a single vectorized kernel call. Returns a HolderResult per address.
+        """
+        token_data_map = token_data_map or {}
+        results: Dict[str, HolderResult] = {}
+        misses = []
+        
+        for address in dict.fromkeys(addresses):
+            cached = None if force else self.cache.get(f"holders_{address}")
+            if cached is not None:
+                results[address] = cached
+            else:
+                misses.append(address)
+        
+        if not misses:
+            return results
+        
+        try:
+            dex_data_map = await self.dex_batch.get_many(misses, session=await self._get_session())
+        except Exception as e:
+            logger.warning("Batch holder lookup failed: %s", e)
+            dex_data_map = {}
+        
+        rows = [
+            self._extract_holder_fields(token_data_map.get(address), dex_data_map.get(address))
+            for address in misses
+        ]
+        total_holders, top_10, top_20, dev_wallet, growth = zip(*rows)
+        scores = _score_distribution_vec(
+            np.array(total_holders, dtype=np.int64),
+            np.array(top_10, dtype=np.float64),
+            np.array(dev_wallet, dtype=np.float64),
+            np.empty(len(misses))
+        )
+        
+        for i, address in enumerate(misses):
+            result = HolderResult(
+                total_holders=total_holders[i],
+                top_10_concentration=top_10[i],
+                top_20_concentration=top_20[i],
+                dev_wallet_percent=dev_wallet[i],
+                growth_rate_per_min=growth[i],
+                distribution_score=float(scores[i])
+            )
+            self.cache[f"holders_{address}"] = result
+            results[address] = result
+        
+        logger.info("Holder analysis complete for %d tokens (%d cached)", len(misses), len(results) - len(misses))
+        return results
     
     async def _analyze_holders(
         self,
         token_address: str,
-        token_data: Optional[Dict[str, Any]] = None
+        token_data: Optional[Dict[str, Any]] = None,
+        dex_data: Optional[Dict[str, Any]] = None
     ) -> HolderResult:
         """Analyze holder distribution"""
         
+        # Try to fetch from DexScreener for additional info
+        if dex_data is None:
+            dex_data = await self._fetch_dexscreener_data(token_address)
+        
+        (
+            total_holders,
+            top_10_concentration,
+            top_20_concentration,
+            dev_wallet_percent,
+            growth_rate
+        ) = self._extract_holder_fields(token_data, dex_data)
+        
+        # Calculate distribution score (0-100)
+        distribution_score = self._calculate_distribution_score(
+            total_holders,
+            top_10_concentration,
+            dev_wallet_percent
+        )
+        
+        return HolderResult(
+            total_holders=total_holders,
+            top_10_concentration=top_10_concentration,
+            top_20_concentration=top_20_concentration,
+            dev_wallet_percent=dev_wallet_percent,
+            growth_rate_per_min=growth_rate,
+            distribution_score=distribution_score
+        )
+    
+    def _extract_holder_fields(
+        self,
+        token_data: Optional[Dict[str, Any]],
+        dex_data: Optional[Dict[str, Any]]
+    ) -> Tuple[int, float, float, float, float]:
+        """
+        Pull holder metrics from scanner data and a DexScreener response
+        
+        Returns (total_holders, top_10_concentration, top_20_concentration,
+        dev_wallet_percent, growth_rate).
+        """
+        
         # Start with defaults
         total_holders = 0
         top_10_concentration = 100.0
@@ -83,10 +319,7 @@ class HolderAnalyzer:
             total_holders = token_data.get('holders', 0)
             growth_rate = token_data.get('holder_growth_rate', 0.0)
         
-        # Try to fetch from DexScreener for additional info
         try:
-            dex_data = await self._fetch_dexscreener_data(token_address)
-            
             if dex_data and 'pairs' in dex_data and dex_data['pairs']:
                 pair = dex_data['pairs'][0]
                 
@@ -118,43 +351,24 @@ class HolderAnalyzer:
                         top_20_concentration = 90.0
                 
         except Exception as e:
-            logger.warning(f"Could not fetch additional holder data: {e}")
+            logger.warning("Could not fetch additional holder data: %s", e)
         
-        # Calculate distribution score (0-100)
-        distribution_score = self._calculate_distribution_score(
+        return (
             total_holders,
             top_10_concentration,
-            dev_wallet_percent
-        )
-        
-        return HolderResult(
-            total_holders=total_holders,
-            top_10_concentration=top_10_concentration,
-            top_20_concentration=top_20_concentration,
-            dev_wallet_percent=dev_wallet_percent,
-            growth_rate_per_min=growth_rate,
-            distribution_score=distribution_score
+            top_20_concentration,
+            dev_wallet_percent,
+            growth_rate
         )
     
     async def _fetch_dexscreener_data(self, token_address: str) -> Dict[str, Any]:
-        """Fetch data from DexScreener API"""
-        
-        url = f"https://api.dexscreener.com/latest/dex/tokens/{token_address}"
+        """Fetch data from DexScreener API (shared with other analyzers)"""
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    timeout=aiohttp.ClientTimeout(total=self.timeout)
-                ) as response:
-                    
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        return {}
-                        
+            session = await self._get_session()
+            return await get_dex(token_address, session, self.timeout)
         except Exception as e:
-            logger.debug(f"DexScreener fetch error: {e}")
+            logger.debug("DexScreener fetch error: %s", e)
             return {}
     
     def _calculate_distribution_score(
@@ -165,42 +379,8 @@ class HolderAnalyzer:
     ) -> float:
         """Calculate holder distribution score (0-100)"""
         
-        score = 0.0
-        
-        # Number of holders (40 points)
-        if total_holders >= 1000:
-            score += 40
-        elif total_holders >= 500:
-            score += 35
-        elif total_holders >= 200:
-            score += 30
-        elif total_holders >= 100:
-            score += 25
-        elif total_holders >= 50:
-            score += 20
-        elif total_holders >= 20:
-            score += 10
-        
-        # Top 10 concentration (40 points)
-        # Lower is better
-        if top_10_concentration <= 20:
-            score += 40
-        elif top_10_concentration <= 30:
-            score += 30
-        elif top_10_concentration <= 40:
-            score += 20
-        elif top_10_concentration <= 50:
-            score += 10
-        
-        # Dev wallet (20 points)
-        # Lower is better
-        if dev_wallet_percent <= 5:
-            score += 20
-        elif dev_wallet_percent <= 10:
-            score += 15
-        elif dev_wallet_percent <= 15:
-            score += 10
-        elif dev_wallet_percent <= 20:
-            score += 5
-        
-        return min(100.0, score)
+        return _score_distribution_scalar(
+            int(total_holders),
+            float(top_10_concentration),
+            float(dev_wallet_percent)
+        )
@@ -4,26 +4,119 @@ Liquidity Analyzer - Analyzes token liquidity metrics
 
 import aiohttp
 import asyncio
-from typing import Dict, Any, Optional
+from bisect import bisect_right
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+from src.utils.cache import AdaptiveTTL, TTLCache
+from src.utils.dex_batch import DexScreenerBatch
+from src.utils.http import client_timeout
+from src.utils.jit import NUMBA_AVAILABLE, njit, prange
 from src.utils.logger import get_logger
+from src.utils.shared_cache import get_dex
 from src.models.token_data import LiquidityResult
 
 logger = get_logger(__name__)
 
+# Stability score ladders: points[bisect_right(thresholds, value)]
+_LIQ_THRESHOLDS = [10_000, 20_000, 50_000, 100_000]  # USD, at least
+_LIQ_POINTS = [0, 10, 20, 30, 40]
+_PI_THRESHOLDS = [1, 3, 5, 10]  # % price impact of a $1k trade, below
+_PI_POINTS = [20, 15, 10, 5, 0]
+
+# Array copies of the ladders for batch scoring
+_LIQ_THRESHOLDS_ARR = np.array(_LIQ_THRESHOLDS, dtype=np.float64)
+_LIQ_POINTS_ARR = np.array(_LIQ_POINTS, dtype=np.float64)
+_PI_THRESHOLDS_ARR = np.array(_PI_THRESHOLDS, dtype=np.float64)
+_PI_POINTS_ARR = np.array(_PI_POINTS, dtype=np.float64)
+
+# Returned when analysis fails; results are frozen, so one instance is shared
+_EMPTY_LIQUIDITY_RESULT = LiquidityResult(
+    total_liquidity_usd=0.0,
+    liquidity_sol=0.0,
+    lp_locked_percent=0.0,
+    lp_burned_percent=0.0,
+    liquidity_stability_score=0.0
+)
+
+
+@njit(cache=True, parallel=True)
+def _score_stability_vec(liquidity_usd, lp_locked, lp_burned, price_impact_1k, out):
+    """Score a batch of tokens into out in one fused pass, one element per token"""
+    for i in prange(liquidity_usd.shape[0]):
+        score = _LIQ_POINTS_ARR[np.searchsorted(_LIQ_THRESHOLDS_ARR, liquidity_usd[i], side='right')]
+        score += min(40.0, (lp_locked[i] + lp_burned[i]) * 0.4)
+        score += _PI_POINTS_ARR[np.searchsorted(_PI_THRESHOLDS_ARR, price_impact_1k[i], side='right')]
+        out[i] = min(100.0, score)
+    return out
+
+
+def _stability_scores(
+    liquidity_usd: np.ndarray,
+    lp_locked: np.ndarray,
+    lp_burned: np.ndarray,
+    price_impact_1k: np.ndarray
+) -> np.ndarray:
+    """
+    Vectorized _calculate_stability_score over arrays of tokens
+    
+    Uses the compiled kernel when numba is installed; otherwise whole-array
+    NumPy operations, which beat an interpreted per-element loop.
+    """
+    if NUMBA_AVAILABLE:
+        return _score_stability_vec(
+            liquidity_usd,
+            lp_locked,
+            lp_burned,
+            price_impact_1k,
+            np.empty(liquidity_usd.shape[0])
+        )
+    
+    score = _LIQ_POINTS_ARR[np.searchsorted(_LIQ_THRESHOLDS_ARR, liquidity_usd, side='right')]
+    score += np.minimum(40, (lp_locked + lp_burned) * 0.4)
+    score += _PI_POINTS_ARR[np.searchsorted(_PI_THRESHOLDS_ARR, price_impact_1k, side='right')]
+    return np.minimum(100.0, score, out=score)
+
+
+def warm_up():
+    """Compile the stability kernel ahead of the first real scan"""
+    _stability_scores(np.array([10000.0]), np.array([0.0]), np.array([0.0]), np.array([1.0]))
+
 
 class LiquidityAnalyzer:
     """Analyzes token liquidity depth and quality"""
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    FAILED_RESULT = _EMPTY_LIQUIDITY_RESULT  # Returned when analysis fails
+    
+    def __init__(
+        self,
+        config: Optional[Dict[str, Any]] = None,
+        session: Optional[aiohttp.ClientSession] = None
+    ):
         """Initialize liquidity analyzer"""
         self.config = config or {}
+        self.session = session  # Shared session, owned by the caller
+        self._session: Optional[aiohttp.ClientSession] = None  # Created lazily when none is shared
         self.timeout = self.config.get('timeout', 10)
-        self.cache = {}
+        # Keep the DexScreener response on results; off by default so cached
+        # results do not pin upstream JSON
+        self.store_raw = self.config.get('store_raw', False)
         self.cache_ttl = 30
+        self.cache = TTLCache(maxsize=self.config.get('cache_max', 10000), ttl=self.cache_ttl)
+        self.adaptive_ttl = AdaptiveTTL(initial=self.cache_ttl)  # Longer TTLs for steady tokens
+        self.dex_batch = DexScreenerBatch(timeout=self.timeout, cache_ttl=self.cache_ttl)
+        self._inflight: Dict[str, asyncio.Future] = {}  # Analyses currently running, by cache key
         
         logger.info("Liquidity Analyzer initialized")
     
-    async def analyze(self, token_address: str, token_data: Optional[Dict[str, Any]] = None) -> LiquidityResult:
+    async def analyze(
+        self,
+        token_address: str,
+        token_data: Optional[Dict[str, Any]] = None,
+        force: bool = False,
+        dex_data: Optional[Dict[str, Any]] = None
+    ) -> LiquidityResult:
         """
         Analyze liquidity metrics
         
@@ -33,60 +126,160 @@ class LiquidityAnalyzer:
         - LP burn %
         - Price impact for trades
         - Liquidity stability score
+        
+        Pass dex_data (a pre-fetched DexScreener response, e.g. from
+        DexScreenerBatch) to skip the per-token lookup.
         """
         
-        try:
-            # Check cache
-            cache_key = f"liquidity_{token_address}"
-            if cache_key in self.cache:
-                cached_data, cached_time = self.cache[cache_key]
-                if (asyncio.get_event_loop().time() - cached_time) < self.cache_ttl:
-                    logger.debug(f"Using cached liquidity data for {token_address}")
-                    return cached_data
+        # Check cache (force=True always refetches)
+        cache_key = f"liquidity_{token_address}"
+        if not force:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.debug("Using cached liquidity data for %s", token_address)
+                return cached
             
-            # Fetch liquidity data from DexScreener
-            data = await self._fetch_dexscreener_data(token_address)
+            # Join an identical analysis that is already running rather than
+            # repeating it for every concurrent caller
+            pending = self._inflight.get(cache_key)
+            if pending is not None:
+                return await asyncio.shield(pending)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            result = await self._analyze_uncached(token_address, token_data, dex_data)
+            future.set_result(result)
+            return result
+        finally:
+            if not future.done():
+                future.cancel()
+            if self._inflight.get(cache_key) is future:
+                del self._inflight[cache_key]
+    
+    async def _analyze_uncached(
+        self,
+        token_address: str,
+        token_data: Optional[Dict[str, Any]] = None,
+        dex_data: Optional[Dict[str, Any]] = None
+    ) -> LiquidityResult:
+        """Run the analysis and cache the result"""
+        
+        try:
+            # Fetch liquidity data from DexScreener unless it was batch-fetched
+            data = dex_data
+            if data is None:
+                data = await self._fetch_dexscreener_data(token_address)
             
             # Parse the response
             result = self._parse_liquidity_data(data, token_data)
             
             # Cache the result
-            self.cache[cache_key] = (result, asyncio.get_event_loop().time())
+            self._cache_result(token_address, result)
             
-            logger.info(f"Liquidity analysis complete for {token_address}: ${result.total_liquidity_usd:.2f}")
+            logger.info("Liquidity analysis complete for %s: $%.2f", token_address, result.total_liquidity_usd)
             return result
             
         except Exception as e:
-            logger.error(f"Liquidity analysis failed for {token_address}: {e}")
+            logger.error("Liquidity analysis failed for %s: %s", token_address, e)
             # Return defaults on error
-            return LiquidityResult(
-                total_liquidity_usd=0.0,
-                liquidity_sol=0.0,
-                lp_locked_percent=0.0,
-                lp_burned_percent=0.0,
-                liquidity_stability_score=0.0
+            return _EMPTY_LIQUIDITY_RESULT
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, or a pooled one owned by this analyzer"""
+        if self.session is not None:
+            return self.session
+        
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300, keepalive_timeout=60),
+                timeout=client_timeout(self.timeout)
             )
+        return self._session
     
-    async def _fetch_dexscreener_data(self, token_address: str) -> Dict[str, Any]:
-        """Fetch liquidity data from DexScreener API"""
+    async def close(self):
+        """Close the session this analyzer created (a shared one is left open)"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def analyze_many(
+        self,
+        addresses: List[str],
+        token_data_map: Optional[Dict[str, Dict[str, Any]]] = None,
+        force: bool = False
+    ) -> Dict[str, LiquidityResult]:
+        """
+        Analyze liquidity for many tokens at once
+        
+        Cache misses are resolved with batched DexScreener requests (up to 30
+        tokens each) and their stability scores computed in one vectorized
+        pass. Returns a LiquidityResult per address.
+        """
+        token_data_map = token_data_map or {}
+        results: Dict[str, LiquidityResult] = {}
+        misses = []
         
-        url = f"https://api.dexscreener.com/latest/dex/tokens/{token_address}"
+        for address in dict.fromkeys(addresses):
+            cached = None if force else self.cache.get(f"liquidity_{address}")
+            if cached is not None:
+                results[address] = cached
+            else:
+                misses.append(address)
+        
+        if not misses:
+            return results
+        
+        try:
+            dex_data_map = await self.dex_batch.get_many(misses, session=await self._get_session())
+        except Exception as e:
+            logger.warning("Batch liquidity lookup failed: %s", e)
+            dex_data_map = {}
+        
+        parsed = []
+        for address in misses:
+            data = dex_data_map.get(address, {})
+            if not data or not data.get('pairs'):
+                # No pair data: fall back to the scanner's figures
+                result = self._parse_liquidity_data(data, token_data_map.get(address))
+                self._cache_result(address, result)
+                results[address] = result
+                continue
+            
+            try:
+                parsed.append((address, data, self._extract_pair_fields(data['pairs'][0])))
+            except Exception as e:
+                logger.error("Error parsing liquidity data: %s", e)
+                results[address] = _EMPTY_LIQUIDITY_RESULT
+                self._cache_result(address, _EMPTY_LIQUIDITY_RESULT)
+        
+        if parsed:
+            columns = np.array([fields for _, _, fields in parsed], dtype=np.float64)
+            scores = _stability_scores(columns[:, 0], columns[:, 2], columns[:, 3], columns[:, 4])
+            
+            for (address, data, fields), score in zip(parsed, scores.tolist()):
+                result = self._build_result(data, fields, score)
+                self._cache_result(address, result)
+                results[address] = result
+        
+        logger.info("Liquidity analysis complete for %d tokens (%d cached)", len(misses), len(results) - len(misses))
+        return results
+    
+    def _cache_result(self, token_address: str, result: LiquidityResult):
+        """Cache a result for as long as this token's liquidity has been steady"""
+        ttl = self.adaptive_ttl.observe(
+            token_address,
+            (result.total_liquidity_usd, result.liquidity_stability_score)
+        )
+        self.cache.set(f"liquidity_{token_address}", result, ttl)
+    
+    async def _fetch_dexscreener_data(self, token_address: str) -> Dict[str, Any]:
+        """Fetch liquidity data from DexScreener API (shared with other analyzers)"""
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    timeout=aiohttp.ClientTimeout(total=self.timeout)
-                ) as response:
-                    
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        logger.warning(f"DexScreener API returned status {response.status}")
-                        return {}
-                        
+            return await get_dex(token_address, await self._get_session(), self.timeout)
         except Exception as e:
-            logger.error(f"DexScreener API error: {e}")
+            logger.error("DexScreener API error: %s", e)
             return {}
     
     def _parse_liquidity_data(
@@ -107,41 +300,12 @@ class LiquidityAnalyzer:
                     liquidity_stability_score=50.0
                 )
             
-            return LiquidityResult(
-                total_liquidity_usd=0.0,
-                liquidity_sol=0.0,
-                lp_locked_percent=0.0,
-                lp_burned_percent=0.0,
-                liquidity_stability_score=0.0
-            )
+            return _EMPTY_LIQUIDITY_RESULT
         
         try:
             # Get the main pair (usually first one)
-            pair = data['pairs'][0]
-            
-            # Extract liquidity data
-            liquidity_usd = float(pair.get('liquidity', {}).get('usd', 0))
-            
-            # Estimate SOL liquidity (assuming SOL ~$100)
-            sol_price = 100.0  # TODO: Get real SOL price
-            liquidity_sol = liquidity_usd / (2 * sol_price)  # Divide by 2 as it's split in pair
-            
-            # LP lock/burn data
-            lp_locked = 0.0
-            lp_burned = 0.0
-            
-            # DexScreener may have this in different formats
-            if 'liquidity' in pair:
-                liq_info = pair['liquidity']
-                if isinstance(liq_info, dict):
-                    # Some DEXes provide lock info
-                    lp_locked = float(liq_info.get('locked', 0))
-                    lp_burned = float(liq_info.get('burned', 0))
-            
-            # Calculate price impact estimates
-            # Simple heuristic: higher liquidity = lower impact
-            price_impact_1k = self._estimate_price_impact(liquidity_usd, 1000)
-            price_impact_5k = self._estimate_price_impact(liquidity_usd, 5000)
+            fields = self._extract_pair_fields(data['pairs'][0])
+            liquidity_usd, _, lp_locked, lp_burned, price_impact_1k, _ = fields
             
             # Calculate liquidity stability score (0-100)
             stability_score = self._calculate_stability_score(
@@ -151,26 +315,64 @@ class LiquidityAnalyzer:
                 price_impact_1k
             )
             
-            return LiquidityResult(
-                total_liquidity_usd=liquidity_usd,
-                liquidity_sol=liquidity_sol,
-                lp_locked_percent=lp_locked,
-                lp_burned_percent=lp_burned,
-                price_impact_1k_usd=price_impact_1k,
-                price_impact_5k_usd=price_impact_5k,
-                liquidity_stability_score=stability_score,
-                raw_data=data
-            )
+            return self._build_result(data, fields, stability_score)
             
         except Exception as e:
-            logger.error(f"Error parsing liquidity data: {e}")
-            return LiquidityResult(
-                total_liquidity_usd=0.0,
-                liquidity_sol=0.0,
-                lp_locked_percent=0.0,
-                lp_burned_percent=0.0,
-                liquidity_stability_score=0.0
-            )
+            logger.error("Error parsing liquidity data: %s", e)
+            return _EMPTY_LIQUIDITY_RESULT
+    
+    def _extract_pair_fields(self, pair: Dict[str, Any]) -> Tuple[float, float, float, float, float, float]:
+        """
+        Read liquidity figures from a DexScreener pair
+        
+        Returns (liquidity_usd, liquidity_sol, lp_locked, lp_burned,
+        price_impact_1k, price_impact_5k).
+        """
+        
+        # Extract liquidity data
+        liquidity_usd = float(pair.get('liquidity', {}).get('usd', 0))
+        
+        # Estimate SOL liquidity (assuming SOL ~$100)
+        sol_price = 100.0  # TODO: Get real SOL price
+        liquidity_sol = liquidity_usd / (2 * sol_price)  # Divide by 2 as it's split in pair
+        
+        # LP lock/burn data
+        lp_locked = 0.0
+        lp_burned = 0.0
+        
+        # DexScreener may have this in different formats
+        if 'liquidity' in pair:
+            liq_info = pair['liquidity']
+            if isinstance(liq_info, dict):
+                # Some DEXes provide lock info
+                lp_locked = float(liq_info.get('locked', 0))
+                lp_burned = float(liq_info.get('burned', 0))
+        
+        # Calculate price impact estimates
+        # Simple heuristic: higher liquidity = lower impact
+        price_impact_1k = self._estimate_price_impact(liquidity_usd, 1000)
+        price_impact_5k = self._estimate_price_impact(liquidity_usd, 5000)
+        
+        return liquidity_usd, liquidity_sol, lp_locked, lp_burned, price_impact_1k, price_impact_5k
+    
+    def _build_result(
+        self,
+        data: Dict[str, Any],
+        fields: Tuple[float, float, float, float, float, float],
+        stability_score: float
+    ) -> LiquidityResult:
+        """Assemble a LiquidityResult from extracted pair fields"""
+        liquidity_usd, liquidity_sol, lp_locked, lp_burned, price_impact_1k, price_impact_5k = fields
+        return LiquidityResult(
+            total_liquidity_usd=liquidity_usd,
+            liquidity_sol=liquidity_sol,
+            lp_locked_percent=lp_locked,
+            lp_burned_percent=lp_burned,
+            price_impact_1k_usd=price_impact_1k,
+            price_impact_5k_usd=price_impact_5k,
+            liquidity_stability_score=stability_score,
+            raw_data=data if self.store_raw else None
+        )
     
     def _estimate_price_impact(self, liquidity_usd: float, trade_size_usd: float) -> float:
         """Estimate price impact for a given trade size"""
@@ -193,30 +395,14 @@ class LiquidityAnalyzer:
     ) -> float:
         """Calculate liquidity stability score (0-100)"""
         
-        score = 0.0
-        
         # Liquidity amount (40 points)
-        if liquidity_usd >= 100000:
-            score += 40
-        elif liquidity_usd >= 50000:
-            score += 30
-        elif liquidity_usd >= 20000:
-            score += 20
-        elif liquidity_usd >= 10000:
-            score += 10
+        score = float(_LIQ_POINTS[bisect_right(_LIQ_THRESHOLDS, liquidity_usd)])
         
         # LP locked/burned (40 points)
         total_secured = lp_locked + lp_burned
         score += min(40, total_secured * 0.4)
         
         # Price impact (20 points)
-        if price_impact_1k < 1:
-            score += 20
-        elif price_impact_1k < 3:
-            score += 15
-        elif price_impact_1k < 5:
-            score += 10
-        elif price_impact_1k < 10:
-            score += 5
+        score += _PI_POINTS[bisect_right(_PI_THRESHOLDS, price_impact_1k)]
         
         return min(100.0, score)
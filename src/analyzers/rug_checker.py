@@ -1,25 +0,0 @@
-"""
-Rug Checker - Analyzes tokens for rug pull indicators
-"""
-
-from typing import Dict, Any
-from src.utils.logger import get_logger
-
-logger = get_logger(__name__)
-
-class RugChecker:
-    """Analyzes tokens for rug pull risks"""
-    
-    def __init__(self):
-        """Initialize rug checker"""
-        logger.info("Rug Checker initialized")
-    
-    async def analyze(self, token_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze token for rug indicators"""
-        # TODO: Implement rug detection logic
-        return {
-            'rug_score': 9.0,
-            'red_flags': [],
-            'is_honeypot': False,
-            'can_sell': True
-        }
@@ -4,29 +4,116 @@ RugCheck Analyzer - Integrates with RugCheck.xyz API for security analysis
 
 import aiohttp
 import asyncio
+import random
+import time
 from typing import Dict, Any, Optional
+from src.utils.cache import AdaptiveTTL, TTLCache
+from src.utils.http import client_timeout, host_slot, read_json
 from src.utils.logger import get_logger
 from src.models.token_data import RugCheckResult
 
 logger = get_logger(__name__)
 
+# Statuses worth retrying; any other non-200 answer is final
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Score deducted per reported risk, by severity; other levels are ignored
+_RISK_PENALTIES = {'danger': 2.0, 'warning': 0.5}
+
+# Risk keys that flag a honeypot on their own, whatever the description says
+_HONEYPOT_RISK_TYPES = frozenset({'honeypot'})
+
+BACKOFF_BASE = 1.0  # seconds
+BACKOFF_CAP = 8.0  # seconds
+
+
+# Top-level report sections _parse_response reads; the rest (full holder
+# lists, price history, ...) is dropped right after decoding
+_REPORT_KEYS = ('risks', 'tokenMeta', 'topHolders', 'markets')
+
+
+def slim_rugcheck_report(data: Any) -> Any:
+    """
+    Keep only the parts of a RugCheck report that scoring uses
+    
+    Reports can carry thousands of holders and per-market details; this
+    keeps the top 10 holders and each market's LP info.
+    """
+    if not isinstance(data, dict):
+        return data
+    
+    slim = {key: data[key] for key in _REPORT_KEYS if key in data}
+    if not slim:
+        return data  # Unknown shape; let the parser decide
+    
+    holders = slim.get('topHolders')
+    if isinstance(holders, list):
+        slim['topHolders'] = holders[:10]
+    
+    markets = slim.get('markets')
+    if isinstance(markets, list):
+        slim['markets'] = [
+            {'lp': market.get('lp', {})} if isinstance(market, dict) else market
+            for market in markets
+        ]
+    return slim
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with jitter, so concurrent retries spread out"""
+    return min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt) * random.uniform(0.5, 1.5)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (HTTP-date form is ignored)"""
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+# Conservative defaults returned when analysis fails; results are frozen and
+# this one holds no mutable fields (a tuple of risks, no raw data), so one
+# instance is shared
+_FAILED_RUGCHECK_RESULT = RugCheckResult(
+    overall_score=5.0,
+    mint_authority_frozen=False,
+    freeze_authority_revoked=False,
+    top_10_holders_percent=100.0,
+    lp_locked=False,
+    lp_burned=False,
+    known_risks=("Analysis failed",)
+)
+
 
 class RugCheckAnalyzer:
     """Analyze token security using RugCheck.xyz API"""
     
     BASE_URL = "https://api.rugcheck.xyz/v1"
+    FAILED_RESULT = _FAILED_RUGCHECK_RESULT  # Returned when analysis fails
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(
+        self,
+        config: Optional[Dict[str, Any]] = None,
+        session: Optional[aiohttp.ClientSession] = None
+    ):
         """Initialize RugCheck analyzer"""
         self.config = config or {}
+        self.session = session  # Shared session, owned by the caller
+        self._session: Optional[aiohttp.ClientSession] = None  # Created lazily when none is shared
         self.timeout = self.config.get('timeout', 10)
+        # Keep the (slimmed) report on results; off by default so cached
+        # results do not pin upstream JSON
+        self.store_raw = self.config.get('store_raw', False)
         self.max_retries = self.config.get('max_retries', 3)
-        self.cache = {}  # Simple cache for 30 seconds
         self.cache_ttl = 30
+        self.cache = TTLCache(maxsize=self.config.get('cache_max', 10000), ttl=self.cache_ttl)
+        self.adaptive_ttl = AdaptiveTTL(initial=self.cache_ttl)  # Longer TTLs for steady tokens
+        self._inflight: Dict[str, asyncio.Future] = {}  # Analyses currently running, by cache key
         
         logger.info("RugCheck Analyzer initialized")
     
-    async def analyze(self, token_address: str) -> RugCheckResult:
+    async def analyze(self, token_address: str, force: bool = False) -> RugCheckResult:
         """
         Get comprehensive security analysis from RugCheck.xyz
         
@@ -39,15 +126,36 @@ class RugCheckAnalyzer:
         - Known risks
         """
         
-        try:
-            # Check cache
-            cache_key = f"rugcheck_{token_address}"
-            if cache_key in self.cache:
-                cached_data, cached_time = self.cache[cache_key]
-                if (asyncio.get_event_loop().time() - cached_time) < self.cache_ttl:
-                    logger.debug(f"Using cached RugCheck data for {token_address}")
-                    return cached_data
+        # Check cache (force=True always refetches)
+        cache_key = f"rugcheck_{token_address}"
+        if not force:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.debug("Using cached RugCheck data for %s", token_address)
+                return cached
             
+            # Join an identical analysis that is already running rather than
+            # repeating it for every concurrent caller
+            pending = self._inflight.get(cache_key)
+            if pending is not None:
+                return await asyncio.shield(pending)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            result = await self._analyze_uncached(token_address)
+            future.set_result(result)
+            return result
+        finally:
+            if not future.done():
+                future.cancel()
+            if self._inflight.get(cache_key) is future:
+                del self._inflight[cache_key]
+    
+    async def _analyze_uncached(self, token_address: str) -> RugCheckResult:
+        """Fetch, parse and cache the report"""
+        
+        try:
             # Fetch from API with retries
             data = await self._fetch_with_retry(token_address)
             
@@ -55,72 +163,110 @@ class RugCheckAnalyzer:
             result = self._parse_response(data, token_address)
             
             # Cache the result
-            self.cache[cache_key] = (result, asyncio.get_event_loop().time())
+            self._cache_result(token_address, result)
             
-            logger.info(f"RugCheck analysis complete for {token_address}: score={result.overall_score}")
+            logger.info("RugCheck analysis complete for %s: score=%s", token_address, result.overall_score)
             return result
             
         except Exception as e:
-            logger.error(f"RugCheck analysis failed for {token_address}: {e}")
+            logger.error("RugCheck analysis failed for %s: %s", token_address, e)
             # Return conservative defaults on error
-            return RugCheckResult(
-                overall_score=5.0,
-                mint_authority_frozen=False,
-                freeze_authority_revoked=False,
-                top_10_holders_percent=100.0,
-                lp_locked=False,
-                lp_burned=False,
-                known_risks=["Analysis failed"],
-                raw_data={}
+            return _FAILED_RUGCHECK_RESULT
+    
+    def _cache_result(self, token_address: str, result: RugCheckResult):
+        """Cache a result for as long as this token's report has been steady"""
+        ttl = self.adaptive_ttl.observe(
+            token_address,
+            (
+                result.overall_score,
+                result.top_10_holders_percent,
+                result.mint_authority_frozen,
+                result.freeze_authority_revoked,
+                result.lp_locked,
+                result.lp_burned
             )
+        )
+        self.cache.set(f"rugcheck_{token_address}", result, ttl)
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, or a pooled one owned by this analyzer"""
+        if self.session is not None:
+            return self.session
+        
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300, keepalive_timeout=60),
+                timeout=client_timeout(self.timeout)
+            )
+        return self._session
+    
+    async def close(self):
+        """Close the session this analyzer created (a shared one is left open)"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
     
     async def _fetch_with_retry(self, token_address: str) -> Dict[str, Any]:
-        """Fetch data from API with exponential backoff retry"""
+        """
+        Fetch data from API, retrying transient failures
+        
+        Only 429, 5xx gateway errors, timeouts and connection errors are
+        retried. Waits honor Retry-After when the API sends it and otherwise
+        use jittered exponential backoff, so concurrent callers do not retry
+        in lockstep. All waits together stay within timeout * max_retries.
+        
+        Returns {} when RugCheck answers that it has no report (404 or another
+        final status). Raises ConnectionError once retries are exhausted, so
+        an outage yields the uncached failure result rather than a cacheable
+        "no data" one.
+        """
         
         url = f"{self.BASE_URL}/tokens/{token_address}/report"
+        session = await self._get_session()
+        deadline = time.monotonic() + self.timeout * self.max_retries
         
         for attempt in range(self.max_retries):
+            retry_after = None
             try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(
-                        url,
-                        timeout=aiohttp.ClientTimeout(total=self.timeout)
-                    ) as response:
-                        
-                        if response.status == 200:
-                            return await response.json()
-                        
-                        elif response.status == 429:
-                            # Rate limited - wait and retry
-                            wait_time = (2 ** attempt) * 1
-                            logger.warning(f"RugCheck rate limit hit, waiting {wait_time}s")
-                            await asyncio.sleep(wait_time)
-                            continue
-                        
-                        elif response.status == 404:
-                            logger.warning(f"Token {token_address} not found on RugCheck")
-                            return {}
-                        
-                        else:
-                            logger.warning(f"RugCheck API returned status {response.status}")
-                            if attempt < self.max_retries - 1:
-                                await asyncio.sleep(2 ** attempt)
-                                continue
-                            return {}
-                            
-            except asyncio.TimeoutError:
-                logger.warning(f"RugCheck API timeout (attempt {attempt + 1}/{self.max_retries})")
-                if attempt < self.max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)
-                    continue
+                async with host_slot(url), session.get(
+                    url,
+                    timeout=client_timeout(self.timeout)
+                ) as response:
+                    
+                    if response.status == 200:
+                        return slim_rugcheck_report(await read_json(response))
+                    
+                    if response.status == 404:
+                        logger.warning("Token %s not found on RugCheck", token_address)
+                        return {}
                     
+                    if response.status not in RETRYABLE_STATUSES:
+                        logger.warning("RugCheck API returned status %d", response.status)
+                        return {}
+                    
+                    if response.status == 429:
+                        logger.warning("RugCheck rate limit hit")
+                    else:
+                        logger.warning("RugCheck API returned status %d", response.status)
+                    retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+                    
+            except asyncio.TimeoutError:
+                logger.warning("RugCheck API timeout (attempt %d/%d)", attempt + 1, self.max_retries)
+                
             except Exception as e:
-                logger.error(f"RugCheck API error: {e}")
-                if attempt < self.max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)
-                    continue
+                logger.error("RugCheck API error: %s", e)
+            
+            if attempt == self.max_retries - 1:
+                break
+            
+            # Sleep outside the request so the host slot is free meanwhile
+            wait_time = retry_after if retry_after is not None else _backoff_delay(attempt)
+            if time.monotonic() + wait_time > deadline:
+                logger.warning("RugCheck retry budget exhausted for %s", token_address)
+                break
+            await asyncio.sleep(wait_time)
         
-        return {}
+        raise ConnectionError(f"RugCheck unavailable for {token_address}")
     
     def _parse_response(self, data: Dict[str, Any], token_address: str) -> RugCheckResult:
         """Parse RugCheck API response into RugCheckResult"""
@@ -134,25 +280,34 @@ class RugCheckAnalyzer:
                 top_10_holders_percent=100.0,
                 lp_locked=False,
                 lp_burned=False,
-                known_risks=["No data available"],
-                raw_data={}
+                known_risks=("No data available",)
             )
         
         try:
             # Extract security score (0-10 scale)
             # RugCheck returns various risk scores - we normalize to 0-10
-            risk_score = data.get('risks', {})
+            risks = data.get('risks', {})
             overall_score = 10.0  # Start with perfect score
+            known_risks = []
+            is_honeypot = False
             
-            # Deduct points for risks
-            if isinstance(risk_score, dict):
-                for risk_type, risk_data in risk_score.items():
-                    if isinstance(risk_data, dict):
-                        severity = risk_data.get('level', 0)
-                        if severity == 'danger':
-                            overall_score -= 2.0
-                        elif severity == 'warning':
-                            overall_score -= 0.5
+            # Deduct points for risks and collect their descriptions in one pass
+            if isinstance(risks, dict):
+                for risk_type, risk_data in risks.items():
+                    if not isinstance(risk_data, dict):
+                        continue
+                    penalty = _RISK_PENALTIES.get(risk_data.get('level'))
+                    if penalty is None:
+                        continue
+                    
+                    overall_score -= penalty
+                    description = risk_data.get('description', risk_type)
+                    known_risks.append(description)
+                    if not is_honeypot:
+                        is_honeypot = (
+                            risk_type in _HONEYPOT_RISK_TYPES or
+                            'honeypot' in str(description).lower()
+                        )
             
             overall_score = max(0.0, min(10.0, overall_score))
             
@@ -185,15 +340,6 @@ class RugCheckAnalyzer:
                 if lp_info.get('lpBurnPct', 0) > 0:
                     lp_burned = True
             
-            # Extract known risks
-            known_risks = []
-            if 'risks' in data:
-                for risk_type, risk_data in data['risks'].items():
-                    if isinstance(risk_data, dict) and risk_data.get('level') in ['danger', 'warning']:
-                        known_risks.append(risk_data.get('description', risk_type))
-            
-            # Check for honeypot
-            is_honeypot = any('honeypot' in str(risk).lower() for risk in known_risks)
             can_sell = not is_honeypot
             
             return RugCheckResult(
@@ -206,11 +352,11 @@ class RugCheckAnalyzer:
                 known_risks=known_risks,
                 is_honeypot=is_honeypot,
                 can_sell=can_sell,
-                raw_data=data
+                raw_data=data if self.store_raw else None
             )
             
         except Exception as e:
-            logger.error(f"Error parsing RugCheck response: {e}")
+            logger.error("Error parsing RugCheck response: %s", e)
             return RugCheckResult(
                 overall_score=5.0,
                 mint_authority_frozen=False,
@@ -218,6 +364,6 @@ class RugCheckAnalyzer:
                 top_10_holders_percent=100.0,
                 lp_locked=False,
                 lp_burned=False,
-                known_risks=["Parse error"],
-                raw_data=data
+                known_risks=("Parse error",),
+                raw_data=data if self.store_raw else None
             )
@@ -5,9 +5,16 @@ Configuration Manager
 import os
 import yaml
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 from dotenv import load_dotenv
 
+# libyaml's C loader parses several times faster; PyYAML builds without it
+# only ship the pure-Python one
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 class Config:
     """Configuration manager for the bot"""
     
@@ -18,11 +25,7 @@ class Config:
         
         # Load YAML config
         self.config_path = Path(config_path)
-        if self.config_path.exists():
-            with open(self.config_path, 'r') as f:
-                self.config = yaml.safe_load(f)
-        else:
-            self.config = {}
+        self.reload()
         
         # Environment variables
         self.telegram_token = os.getenv('TELEGRAM_BOT_TOKEN')
@@ -30,17 +33,36 @@ class Config:
         self.discord_webhook = os.getenv('DISCORD_WEBHOOK_URL')
         self.helius_api_key = os.getenv('HELIUS_API_KEY')
         self.database_url = os.getenv('DATABASE_URL', 'sqlite:///data/scanner.db')
+        self.cache_policy = os.getenv('CACHE_POLICY')  # Overrides cache.policy when set
+    
+    def reload(self):
+        """(Re)read the YAML file and rebuild the lookup tables"""
+        if self.config_path.exists():
+            # Hand libyaml the whole buffer instead of a file it reads line by line
+            self.config = yaml.load(self.config_path.read_bytes(), Loader=_SafeLoader) or {}
+        else:
+            self.config = {}
+        
+        # Every node reachable in the config, keyed by its key path, so lookups
+        # are one dict probe instead of a walk per call
+        self._paths: Dict[Tuple[Any, ...], Any] = {}
+        self._index(self.config, ())
+        self._flat: Dict[str, Any] = {
+            '.'.join(path): value
+            for path, value in self._paths.items()
+            if path and all(isinstance(k, str) for k in path)
+        }
+    
+    def _index(self, node: Any, path: Tuple[Any, ...]):
+        """Record node and, for dicts, everything beneath it"""
+        self._paths[path] = node
+        if isinstance(node, dict):
+            for key, value in node.items():
+                self._index(value, path + (key,))
         
     def get(self, key: str, default: Any = None) -> Any:
-        """Get configuration value"""
-        keys = key.split('.')
-        value = self.config
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k, default)
-            else:
-                return default
-        return value
+        """Get configuration value by dotted key (e.g. 'alerts.min_score')"""
+        return self._flat.get(key, default)
     
     def get_nested(self, *keys, default: Any = None) -> Any:
         """
@@ -50,12 +72,5 @@ class Config:
             config.get_nested('alerts', 'min_score', default=70)
             config.get_nested('machine_learning', 'enabled', default=True)
         """
-        value = self.config
-        for key in keys:
-            if isinstance(value, dict):
-                value = value.get(key)
-                if value is None:
-                    return default
-            else:
-                return default
+        value = self._paths.get(keys)
         return value if value is not None else default
@@ -3,56 +3,187 @@ Core Orchestrator - Coordinates all bot components
 """
 
 import asyncio
+import signal
 import time
 import traceback
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, List, Optional, Tuple, Union
 from datetime import datetime
 
+import aiohttp
+import numpy as np
+
+from src.utils.analyzer_cache import AnalyzerCache, config_hash
+from src.utils.cache import TTLCache
+from src.utils.dex_batch import DexScreenerBatch
+from src.utils.http import client_timeout
 from src.utils.logger import get_logger, setup_logger
+from src.utils.rate_limiter import DEFAULT_HOST_RPM, set_host_rate_limit
 from src.core.config import Config
 from src.database.db_manager import DatabaseManager
-from src.ml.inference.predictor import MLPredictor
+from src.ml.inference.predictor import FEATURE_INDEX, FEATURE_ORDER, N_FEATURES, MLPredictor
 from src.notifications.notification_manager import NotificationManager
 
 from src.scanners.pumpfun_scanner import PumpFunScanner
 from src.scanners.dexscreener_scanner import DexScreenerScanner
 from src.analyzers.rugcheck_analyzer import RugCheckAnalyzer
-from src.analyzers.liquidity_analyzer import LiquidityAnalyzer
-from src.analyzers.holder_analyzer import HolderAnalyzer
-from src.scoring.scoring_engine import ScoringEngine
+from src.analyzers.liquidity_analyzer import LiquidityAnalyzer, warm_up as warm_up_liquidity
+from src.analyzers.holder_analyzer import HolderAnalyzer, warm_up as warm_up_holders
+from src.scoring.scoring_engine import ScoringEngine, warm_up as warm_up_scoring
 from src.pattern_detection.pattern_detector import PatternDetector
 
-from src.models.token_data import TokenData, AnalysisResult, ScoringResult
+from src.models.token_data import (
+    TokenData, AnalysisResult, ScoringResult, RugCheckResult, LiquidityResult, HolderResult
+)
+
+logger = get_logger(__name__)
+
+# Quantization step per ML feature for prediction cache keys: tokens whose
+# features agree to within these steps (e.g. same $100 liquidity bucket)
+# share a cached prediction
+_ML_KEY_STEP_OVERRIDES = {
+    'liquidity_usd': 100,
+    'market_cap': 100,
+    'holders': 1,
+    'age_seconds': 10,
+    'volume_24h': 100
+}
+_ML_KEY_STEPS = np.array([_ML_KEY_STEP_OVERRIDES.get(name, 0.01) for name in FEATURE_ORDER])
+
+# Feature-vector slots filled from TokenData, in _build_feature_vector order
+_TOKEN_FEATURE_SLOTS = np.array([
+    FEATURE_INDEX[name]
+    for name in ('liquidity_usd', 'market_cap', 'holders', 'age_seconds', 'price_change_5min', 'volume_24h')
+])
+
+
+def _build_ml_predictor(warm: bool) -> MLPredictor:
+    """MLPredictor, with its pump model loaded and primed if warm"""
+    predictor = MLPredictor()
+    if warm:
+        predictor.warm_up()
+    return predictor
+
+
+def _warm_up_kernels():
+    """Compile (or load from the numba cache) every JIT scoring kernel"""
+    warm_up_scoring()
+    warm_up_holders()
+    warm_up_liquidity()
+
+
+async def _collect_batch(
+    queue: asyncio.Queue,
+    max_size: Union[int, Callable[[], int]],
+    max_wait: float
+) -> Tuple[List[Any], bool]:
+    """
+    Wait for an item on queue, then take more until max_size or max_wait seconds
+    
+    max_size may be a callable, evaluated once the first item has arrived.
+    Returns (batch, done); done is True once the None sentinel was read, and
+    the batch then holds whatever came before it.
+    """
+    loop = asyncio.get_running_loop()
+    batch = []
+    item = await queue.get()
+    deadline = loop.time() + max_wait
+    if callable(max_size):
+        max_size = max_size()
+    
+    while True:
+        if item is None:
+            return batch, True
+        batch.append(item)
+        
+        remaining = deadline - loop.time()
+        if len(batch) >= max_size or remaining <= 0:
+            return batch, False
+        try:
+            item = await asyncio.wait_for(queue.get(), remaining)
+        except asyncio.TimeoutError:
+            return batch, False
 
 
 class Orchestrator:
     """Main orchestrator for the scanner bot"""
     
-    def __init__(self):
-        """Initialize orchestrator"""
-        logger = get_logger(__name__)
+    # Fixed attribute set: slot access is faster than an instance __dict__ on
+    # the per-token path. New attributes must be listed here.
+    __slots__ = (
+        # Components
+        'config', 'db', 'ml_predictor', 'notification_manager',
+        'pumpfun_scanner', 'dexscreener_scanner', '_pumpfun_enabled', '_dexscreener_enabled',
+        'rugcheck_analyzer', 'liquidity_analyzer', 'holder_analyzer', 'dex_batch',
+        'analyzer_cache', '_analyzer_config_hash', '_analyzer_cache_ttls',
+        'scoring_engine', 'pattern_detector',
+        # Runtime resources
+        'http_session', '_stop_event', '_ml_executor', '_db_executor',
+        '_save_queue', '_flusher_task', '_ml_queue', '_ml_batch_task', '_inflight',
+        # Settings (see _load_runtime_settings)
+        'max_alerts_per_day', 'min_alert_score', '_min_ml_confidence', '_category_filters',
+        '_ml_enabled', '_ml_cache', '_ml_min_liquidity', '_analyze_when_silenced', 'max_concurrency',
+        '_poll_interval',
+        # Alert and scan tracking
+        'alerts_sent_today', 'last_alert_reset', '_alert_day', '_next_reset_mono', '_silenced_day', '_recent_alerts',
+        'total_tokens_analyzed', 'total_alerts_sent'
+    )
+    
+    # Seconds during which a token that was alerted on is not alerted on again
+    ALERT_COOLDOWN_SECONDS = 60
+    
+    # Analyses written per database call, and the longest a queued analysis
+    # waits for its batch to fill
+    SAVE_BATCH_SIZE = 50
+    SAVE_FLUSH_SECONDS = 0.2
+    
+    # Feature vectors scored per ML call, and the longest a token waits for
+    # others to share its batch
+    ML_BATCH_SIZE = 16
+    ML_BATCH_SECONDS = 0.02
+    
+    def __init__(
+        self,
+        config: Optional[Config] = None,
+        db: Optional[DatabaseManager] = None,
+        ml_predictor: Optional[MLPredictor] = None,
+        notification_manager: Optional[NotificationManager] = None
+    ):
+        """
+        Initialize orchestrator
+        
+        Components that are not passed in are built here, one after another;
+        use create() from async code to build the slow ones concurrently.
+        """
         logger.info("Initializing Orchestrator...")
         
         # Load configuration
-        self.config = Config()
+        self.config = config or Config()
         logger.info("✅ Configuration loaded")
         
         # Initialize database
-        self.db = DatabaseManager(self.config.database_url)
+        self.db = db or DatabaseManager(self.config.database_url)
         logger.info("✅ Database connected")
         
         # Initialize ML predictor
-        self.ml_predictor = MLPredictor()
-        logger.info("✅ ML models loaded")
+        self.ml_predictor = ml_predictor or MLPredictor()
+        logger.info("✅ ML predictor ready")
         
         # Initialize notification manager
-        self.notification_manager = NotificationManager(self.config)
+        self.notification_manager = notification_manager or NotificationManager(self.config)
         logger.info("✅ Notification manager ready")
         
-        # Initialize scanners
+        # Initialize scanners (disabled ones are never built, so they hold no
+        # sockets or sessions)
         scanner_config = self._get_scanner_config()
-        self.pumpfun_scanner = PumpFunScanner(scanner_config)
-        self.dexscreener_scanner = DexScreenerScanner(scanner_config)
+        self._pumpfun_enabled = self.config.get_nested('scanners', 'pumpfun', 'enabled', default=True)
+        self._dexscreener_enabled = self.config.get_nested('scanners', 'dexscreener', 'enabled', default=True)
+        self.pumpfun_scanner: Optional[PumpFunScanner] = (
+            PumpFunScanner(scanner_config) if self._pumpfun_enabled else None
+        )
+        self.dexscreener_scanner: Optional[DexScreenerScanner] = (
+            DexScreenerScanner(scanner_config) if self._dexscreener_enabled else None
+        )
         logger.info("✅ Scanners initialized")
         
         # Initialize analyzers
@@ -60,6 +191,46 @@ class Orchestrator:
         self.rugcheck_analyzer = RugCheckAnalyzer(analyzer_config)
         self.liquidity_analyzer = LiquidityAnalyzer(analyzer_config)
         self.holder_analyzer = HolderAnalyzer(analyzer_config)
+        self.dex_batch = DexScreenerBatch(timeout=analyzer_config['timeout'])
+        
+        # Requests-per-minute budgets per API host, shared by every analyzer
+        # and scanner calling it
+        rate_limits = {**DEFAULT_HOST_RPM, **(self.config.get_nested('rate_limits', default={}) or {})}
+        for host, rpm in rate_limits.items():
+            set_host_rate_limit(host, rpm)
+        
+        # Persistent result cache in front of the analyzers; the config hash
+        # in each key makes changed analyzer settings miss old entries
+        self.analyzer_cache = AnalyzerCache(
+            path=self.config.get_nested('cache', 'path', default='data/analyzer_cache.db'),
+            policy=self.config.cache_policy or self.config.get_nested('cache', 'policy', default='enabled')
+        )
+        self._analyzer_config_hash = config_hash(analyzer_config)
+        self._analyzer_cache_ttls = {
+            'rugcheck': self.config.get_nested('cache', 'ttl', 'rugcheck', default=300),
+            'liquidity': self.config.get_nested('cache', 'ttl', 'liquidity', default=60),
+            'holders': self.config.get_nested('cache', 'ttl', 'holders', default=60)
+        }
+        self.http_session: Optional[aiohttp.ClientSession] = None  # Opened in start()
+        self._stop_event: Optional[asyncio.Event] = None  # Created in start(), inside the loop
+        
+        # Separate pools so ML inference never queues behind database writes
+        # (or the reverse) in the shared default executor. SQLite allows one
+        # writer at a time, so a single database thread writes batches in
+        # order instead of several threads contending for the file lock.
+        self._ml_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='ml')
+        self._db_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='db')
+        
+        # Write-behind queue for analyses, drained by a flusher task in start()
+        self._save_queue: Optional[asyncio.Queue] = None
+        self._flusher_task: Optional[asyncio.Task] = None
+        
+        # (features, future) pairs waiting for a batched ML call, served by a
+        # task started in start()
+        self._ml_queue: Optional[asyncio.Queue] = None
+        self._ml_batch_task: Optional[asyncio.Task] = None
+        # Recent ML scores by quantized feature vector (see _ML_KEY_STEPS)
+        self._ml_cache = TTLCache(maxsize=4096, ttl=300)
         logger.info("✅ Analyzers initialized")
         
         # Initialize scoring and pattern detection
@@ -71,8 +242,14 @@ class Orchestrator:
         # Alert tracking
         self.alerts_sent_today = 0
         self.last_alert_reset = datetime.utcnow()
-        self.max_alerts_per_day = self.config.get_nested('alerts', 'max_alerts_per_day', 15)
-        self.min_alert_score = self.config.get_nested('alerts', 'min_score', 70)
+        self._alert_day = int(time.time() // 86400)  # UTC day number of the current count
+        self._next_reset_mono = self._next_midnight_mono()  # Monotonic time of the next UTC midnight
+        self._silenced_day: Optional[int] = None  # Day the "limit reached, skipping" notice was logged
+        self._recent_alerts = TTLCache(maxsize=10000, ttl=self.ALERT_COOLDOWN_SECONDS)  # Addresses alerted on lately
+        self._inflight: Dict[str, asyncio.Future] = {}  # Analyses currently running, by address
+        
+        # Settings read for every token
+        self._load_runtime_settings()
         
         # Scan tracking
         self.total_tokens_analyzed = 0
@@ -80,6 +257,61 @@ class Orchestrator:
         
         logger.info("Orchestrator initialization complete!")
     
+    def _load_runtime_settings(self):
+        """Read the settings the per-token path uses into attributes, once"""
+        self.max_alerts_per_day = self.config.get_nested('alerts', 'max_alerts_per_day', default=15)
+        self.min_alert_score = self.config.get_nested('alerts', 'min_score', default=70)
+        self._min_ml_confidence = self.config.get_nested('alerts', 'min_ml_confidence', default=0.65)
+        # Keyed like ScoringResult.category (FAST_SNIPER, ...) so the per-token
+        # check needs no string normalization
+        self._category_filters = {
+            str(name).upper(): enabled
+            for name, enabled in (self.config.get_nested('alerts', 'categories', default={}) or {}).items()
+        }
+        self._ml_enabled = self.config.get_nested('machine_learning', 'enabled', default=True)
+        # Tokens below the alert liquidity floor are not worth an ML inference
+        self._ml_min_liquidity = self.config.get_nested('alerts', 'filters', 'min_liquidity_usd', default=0)
+        # Keep analyzing (and saving) tokens once the daily alert limit is hit
+        self._analyze_when_silenced = self.config.get_nested('alerts', 'analyze_when_silenced', default=False)
+        
+        # Upper bound on tokens analyzed at once, so a burst of new pairs does
+        # not flood the upstream APIs
+        self.max_concurrency = self.config.get_nested('scanners', 'max_concurrency', default=5)
+        # Seconds between scan cycles
+        self._poll_interval = self.config.get_nested('scanners', 'dexscreener', 'poll_interval', default=10) or 10
+    
+    def reload_config(self):
+        """Re-read config.yaml and refresh the cached per-token settings"""
+        self.config.reload()
+        self._load_runtime_settings()
+    
+    @classmethod
+    async def create(cls) -> "Orchestrator":
+        """
+        Build an orchestrator without blocking the event loop
+        
+        The database engine, the ML pump model (when ML is enabled) and the
+        JIT scoring kernels are set up concurrently in worker threads, so
+        startup takes about as long as the slowest of them and the first token
+        does not pay for model loading or kernel compilation. The notification manager is built on the loop, since it
+        owns an asyncio.Queue.
+        """
+        config = Config()
+        db, ml_predictor, _ = await asyncio.gather(
+            asyncio.to_thread(DatabaseManager, config.database_url),
+            asyncio.to_thread(
+                _build_ml_predictor,
+                config.get_nested('machine_learning', 'enabled', default=True)
+            ),
+            asyncio.to_thread(_warm_up_kernels)
+        )
+        return cls(
+            config=config,
+            db=db,
+            ml_predictor=ml_predictor,
+            notification_manager=NotificationManager(config)
+        )
+    
     def _get_scanner_config(self) -> Dict[str, Any]:
         """Get scanner configuration with professional settings"""
         return {
@@ -89,7 +321,7 @@ class Orchestrator:
             'holders_min': 15,
             'market_cap_max': 500000,  # $500k
             'poll_interval': 10,
-            'websocket_url': self.config.get_nested('scanners', 'pumpfun', 'websocket_url', 'wss://api.helius.xyz')
+            'websocket_url': self.config.get_nested('scanners', 'pumpfun', 'websocket_url', default='wss://api.helius.xyz')
         }
     
     def _get_analyzer_config(self) -> Dict[str, Any]:
@@ -102,39 +334,105 @@ class Orchestrator:
     def _get_scoring_config(self) -> Dict[str, Any]:
         """Get scoring configuration"""
         return {
-            'ml_weight': self.config.get_nested('machine_learning', 'ml_weight', 0.40),
-            'rule_weight': self.config.get_nested('machine_learning', 'rule_weight', 0.60)
+            'ml_weight': self.config.get_nested('machine_learning', 'ml_weight', default=0.40),
+            'rule_weight': self.config.get_nested('machine_learning', 'rule_weight', default=0.60)
         }
     
+    def _open_http_session(self):
+        """
+        Open one pooled HTTP session and share it with every analyzer and the
+        DexScreener scanner
+        
+        All HTTP traffic then reuses keep-alive connections instead of
+        paying a TCP+TLS handshake per request. Must run inside the event loop.
+        """
+        timeout = self._get_analyzer_config()['timeout']
+        self.http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                ttl_dns_cache=300,
+                keepalive_timeout=75
+            ),
+            timeout=client_timeout(timeout)
+        )
+        for component in (self.rugcheck_analyzer, self.liquidity_analyzer, self.holder_analyzer, self.dex_batch):
+            component.session = self.http_session
+        if self._dexscreener_enabled:
+            self.dexscreener_scanner.session = self.http_session
+    
     async def start(self):
         """Start the bot and run continuous scanning"""
-        logger = get_logger(__name__)
         logger.info("🚀 Bot is starting...")
         
-        # Start scanners
+        self._stop_event = asyncio.Event()
+        handled_signals = self._install_signal_handlers()
+        self._open_http_session()
+        self._save_queue = asyncio.Queue(maxsize=1000)
+        self._flusher_task = asyncio.create_task(self._flush_saves())
+        self._ml_queue = asyncio.Queue()
+        self._ml_batch_task = asyncio.create_task(self._run_ml_batches())
         try:
-            logger.info("🔌 Connecting to PumpFun scanner...")
-            await self.pumpfun_scanner.connect()
-            logger.info("✅ PumpFun scanner connected")
-        except Exception as e:
-            logger.error(f"Failed to connect PumpFun scanner: {e}")
-            logger.info("⚠️  Continuing with DexScreener only")
+            await self._run_loop()
+        finally:
+            loop = asyncio.get_running_loop()
+            for sig in handled_signals:
+                loop.remove_signal_handler(sig)
+            await self.stop()
+    
+    def request_stop(self):
+        """Ask the scan loop to finish; it wakes immediately instead of sleeping out the interval"""
+        if self._stop_event is not None and not self._stop_event.is_set():
+            logger.info("\n⏹️  Stop requested, shutting down gracefully...")
+            self._stop_event.set()
+    
+    def _install_signal_handlers(self) -> List[signal.Signals]:
+        """Route SIGINT/SIGTERM to request_stop; returns the signals handled"""
+        loop = asyncio.get_running_loop()
+        handled = []
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self.request_stop)
+            except (NotImplementedError, RuntimeError):
+                # Windows event loops, or not running in the main thread
+                continue
+            handled.append(sig)
+        return handled
+    
+    async def _sleep_until_stopped(self, seconds: float) -> bool:
+        """Wait up to seconds; returns True if a stop was requested meanwhile"""
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), seconds)
+        except asyncio.TimeoutError:
+            return False
+        return True
+    
+    async def _run_loop(self):
+        """Connect the scanners and scan until interrupted"""
+        
+        # Start scanners
+        if self._pumpfun_enabled:
+            try:
+                logger.info("🔌 Connecting to PumpFun scanner...")
+                await self.pumpfun_scanner.connect()
+                logger.info("✅ PumpFun scanner connected")
+            except Exception as e:
+                logger.error(f"Failed to connect PumpFun scanner: {e}")
+                logger.info("⚠️  Continuing with DexScreener only")
         
         logger.info("🤖 Bot is running! Waiting for opportunities...")
         
-        # Get configuration values once
-        poll_interval = self.config.get_nested('scanner', 'poll_interval', 10) or 10
         min_score = self.min_alert_score or 70
         
-        logger.info(f"⏱️  Scan interval: {poll_interval} seconds")
+        logger.info(f"⏱️  Scan interval: {self._poll_interval} seconds")
         logger.info(f"🎯 Alert threshold: {min_score}/100")
         logger.info("📱 Alerts will be sent to Telegram")
         logger.info("Press Ctrl+C to stop\n")
         
         scan_count = 0
         
-        # Main infinite loop
-        while True:
+        # Main loop, until request_stop() (SIGINT/SIGTERM) sets the stop event
+        while not self._stop_event.is_set():
             try:
                 scan_count += 1
                 current_time = datetime.now().strftime("%H:%M:%S")
@@ -147,10 +445,15 @@ class Orchestrator:
                 # Status logging every 10 scans
                 if scan_count % 10 == 0:
                     logger.info(f"📊 Status: {scan_count} scans completed, {self.total_tokens_analyzed} tokens analyzed, {self.total_alerts_sent} alerts sent")
+                    logger.info(
+                        f"🧠 ML cache: {self._ml_cache.hits} hits, {self._ml_cache.misses} misses "
+                        f"({self._ml_cache.hit_rate:.0%} hit rate)"
+                    )
                 
                 # Wait before next scan
-                logger.info(f"⏸️  Waiting {poll_interval}s before next scan...\n")
-                await asyncio.sleep(poll_interval)
+                logger.info(f"⏸️  Waiting {self._poll_interval}s before next scan...\n")
+                if await self._sleep_until_stopped(self._poll_interval):
+                    break
                 
             except KeyboardInterrupt:
                 logger.info("\n⏹️  Bot stopped by user (Ctrl+C)")
@@ -161,35 +464,42 @@ class Orchestrator:
                 logger.error(f"❌ Error in main loop: {e}")
                 logger.error(f"Traceback: {traceback.format_exc()}")
                 logger.info("⏳ Waiting 30 seconds before retry...\n")
-                await asyncio.sleep(30)
+                if await self._sleep_until_stopped(30):
+                    break
     
     async def _scan_cycle(self):
         """Run one complete scan cycle"""
-        logger = get_logger(__name__)
         
         try:
             # Scan from both sources
             pumpfun_tokens = []
             dexscreener_tokens = []
             
-            # Scan PumpFun (if connected)
-            try:
-                pumpfun_tokens = await self.pumpfun_scanner.scan()
-                if pumpfun_tokens:
-                    logger.info(f"   └─ PumpFun: Found {len(pumpfun_tokens)} new tokens")
-            except Exception as e:
-                logger.warning(f"   └─ PumpFun scan failed: {e}")
+            # Scan PumpFun (if enabled and connected)
+            if self._pumpfun_enabled:
+                try:
+                    pumpfun_tokens = await self.pumpfun_scanner.scan()
+                    if pumpfun_tokens:
+                        logger.info(f"   └─ PumpFun: Found {len(pumpfun_tokens)} new tokens")
+                except Exception as e:
+                    logger.warning(f"   └─ PumpFun scan failed: {e}")
             
-            # Scan DexScreener
-            try:
-                dexscreener_tokens = await self.dexscreener_scanner.scan_new_pairs()
-                if dexscreener_tokens:
-                    logger.info(f"   └─ DexScreener: Found {len(dexscreener_tokens)} new pairs")
-            except Exception as e:
-                logger.warning(f"   └─ DexScreener scan failed: {e}")
+            # Scan DexScreener (if enabled)
+            if self._dexscreener_enabled:
+                try:
+                    dexscreener_tokens = await self.dexscreener_scanner.scan_new_pairs()
+                    if dexscreener_tokens:
+                        logger.info(f"   └─ DexScreener: Found {len(dexscreener_tokens)} new pairs")
+                except Exception as e:
+                    logger.warning(f"   └─ DexScreener scan failed: {e}")
             
-            # Combine results
-            all_tokens = pumpfun_tokens + dexscreener_tokens
+            # Combine results; a token reported by both scanners is analyzed
+            # (and counted) once
+            tokens_by_address: Dict[Any, Any] = {}
+            for token in pumpfun_tokens + dexscreener_tokens:
+                address = token.address if hasattr(token, 'address') else token.get('address', '')
+                tokens_by_address.setdefault(address or id(token), token)
+            all_tokens = list(tokens_by_address.values())
             
             if not all_tokens:
                 logger.info("   └─ No new tokens found")
@@ -197,28 +507,56 @@ class Orchestrator:
             
             logger.info(f"   └─ Total: {len(all_tokens)} tokens to analyze")
             
-            # Process each token
-            for i, token_data in enumerate(all_tokens, 1):
-                try:
-                    # Handle both TokenData objects and dicts
-                    if hasattr(token_data, 'symbol'):
-                        symbol = token_data.symbol
-                        address = token_data.address
-                    else:
-                        symbol = token_data.get('symbol', 'Unknown')
-                        address = token_data.get('address', 'Unknown')
-                    
-                    logger.info(f"\n📊 [{i}/{len(all_tokens)}] Analyzing: {symbol} ({address[:8]}...)")
-                    
-                    # Convert dict to TokenData if needed
-                    if not hasattr(token_data, 'to_dict'):
-                        token_data = self._dict_to_token_data(token_data)
-                    
-                    await self.process_token(token_data)
-                    self.total_tokens_analyzed += 1
-                except Exception as e:
-                    logger.error(f"   └─ Failed to process token: {e}")
-                    continue
+            # Resolve DexScreener data for the whole cycle in a few batched
+            # requests instead of one lookup per token per analyzer
+            dex_data_by_address = {}
+            try:
+                addresses = [a for a in tokens_by_address if isinstance(a, str)]
+                dex_data_by_address = await self.dex_batch.get_many(addresses)
+            except Exception as e:
+                logger.warning(f"   └─ DexScreener batch lookup failed: {e}")
+            
+            # A fixed pool of at most max_concurrency workers drains the batch,
+            # so a burst of new pairs costs that many tasks rather than one each
+            queue: "asyncio.Queue[Tuple[int, Any]]" = asyncio.Queue()
+            for item in enumerate(all_tokens, 1):
+                queue.put_nowait(item)
+            analyzed = 0
+            
+            async def worker():
+                nonlocal analyzed
+                while not queue.empty():
+                    i, token_data = queue.get_nowait()
+                    try:
+                        # Handle both TokenData objects and dicts
+                        if hasattr(token_data, 'symbol'):
+                            symbol = token_data.symbol
+                            address = token_data.address
+                        else:
+                            symbol = token_data.get('symbol', 'Unknown')
+                            address = token_data.get('address', 'Unknown')
+                        
+                        logger.info(f"\n📊 [{i}/{len(all_tokens)}] Analyzing: {symbol} ({address[:8]}...)")
+                        
+                        # Convert dict to TokenData if needed
+                        if not hasattr(token_data, 'to_dict'):
+                            token_data = self._dict_to_token_data(token_data)
+                        
+                        analysis = await self.process_token(
+                            token_data,
+                            dex_data=dex_data_by_address.get(token_data.address)
+                        )
+                        if analysis is not None:
+                            analyzed += 1
+                            self.total_tokens_analyzed += 1
+                    except Exception as e:
+                        logger.error(f"   └─ Failed to process token: {e}")
+            
+            workers = min(max(1, self.max_concurrency), len(all_tokens))
+            await asyncio.gather(*(worker() for _ in range(workers)))
+            
+            if analyzed < len(all_tokens):
+                logger.info(f"   └─ Analyzed {analyzed}/{len(all_tokens)} tokens ({len(all_tokens) - analyzed} failed or skipped)")
             
         except Exception as e:
             logger.error(f"Scan cycle failed: {e}")
@@ -243,7 +581,11 @@ class Orchestrator:
             raw_data=data
         )
     
-    async def process_token(self, token_data: TokenData):
+    async def process_token(
+        self,
+        token_data: TokenData,
+        dex_data: Optional[Dict[str, Any]] = None
+    ) -> Optional[AnalysisResult]:
         """
         Full analysis pipeline for detected token
         
@@ -253,45 +595,85 @@ class Orchestrator:
         3. Calculate scores
         4. Detect patterns
         5. If score >= threshold: send alert
+        
+        dex_data is the token's pre-fetched DexScreener response, if any.
+        A token already being processed (e.g. reported by two scanners) is
+        not analyzed again; the caller awaits the running analysis instead.
+        Returns the analysis, or None if it failed.
         """
+        address = token_data.address
+        pending = self._inflight.get(address)
+        if pending is not None:
+            logger.debug(f"Joining in-flight analysis for {address}")
+            return await asyncio.shield(pending)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[address] = future
+        try:
+            analysis = await self._process_token_uncached(token_data, dex_data)
+            future.set_result(analysis)
+            return analysis
+        finally:
+            if not future.done():
+                future.cancel()
+            if self._inflight.get(address) is future:
+                del self._inflight[address]
+    
+    async def _process_token_uncached(
+        self,
+        token_data: TokenData,
+        dex_data: Optional[Dict[str, Any]]
+    ) -> Optional[AnalysisResult]:
+        """Run the pipeline for one token; returns None if it failed or was skipped"""
         
-        logger = get_logger(__name__)
-        start_time = time.time()
+        # With today's alerts used up the analysis could only be saved, so
+        # skip it unless data collection was asked for
+        if not self._analyze_when_silenced and self.alerts_sent_today >= self.max_alerts_per_day:
+            self._reset_alert_counter_if_needed()
+            if self.alerts_sent_today >= self.max_alerts_per_day:
+                if self._silenced_day != self._alert_day:
+                    self._silenced_day = self._alert_day
+                    logger.info(f"Daily alert limit reached ({self.max_alerts_per_day}), skipping analysis until tomorrow")
+                return None
+        
+        start_ns = time.perf_counter_ns()
         
         logger.info(f"Processing token: {token_data.symbol} ({token_data.address})")
         
         try:
             # Run all analyzers in parallel
-            analyzer_results = await self._run_analyzers(token_data.address, token_data.to_dict())
+            analyzer_results = await self._run_analyzers(
+                token_data.address,
+                token_data.to_dict(),
+                dex_data
+            )
             
-            # Calculate ML score if available
+            # Get ML score if available
             ml_score = 0.0
             ml_confidence = 0.0
             
-            try:
-                if self.config.get_nested('machine_learning', 'enabled', True):
-                    ml_result = await self._get_ml_score(token_data, analyzer_results)
-                    ml_score = ml_result.get('score', 0.0)
-                    ml_confidence = ml_result.get('confidence', 0.0)
-            except Exception as e:
-                logger.warning(f"ML scoring failed: {e}")
+            if self._ml_enabled and (token_data.liquidity_usd or 0) >= self._ml_min_liquidity:
+                # _get_ml_score handles its own failures and returns zeros
+                ml_result = await self._get_ml_score(self._build_feature_vector(token_data, analyzer_results))
+                ml_score = ml_result['score']
+                ml_confidence = ml_result['confidence']
             
-            # Calculate comprehensive scores
-            scoring_result = self.scoring_engine.calculate_score(
+            # Detect pattern
+            pattern = self.pattern_detector.detect_pattern(
                 token=token_data,
                 rugcheck=analyzer_results.get('rugcheck'),
                 liquidity=analyzer_results.get('liquidity'),
-                holders=analyzer_results.get('holders'),
-                ml_score=ml_score,
-                ml_confidence=ml_confidence
+                holders=analyzer_results.get('holders')
             )
             
-            # Detect pattern
-            pattern = self.pattern_detector.detect_pattern(
+            # Calculate comprehensive scores
+            scoring_result = self.scoring_engine.calculate_score(
                 token=token_data,
                 rugcheck=analyzer_results.get('rugcheck'),
                 liquidity=analyzer_results.get('liquidity'),
-                holders=analyzer_results.get('holders')
+                holders=analyzer_results.get('holders'),
+                ml_score=ml_score,
+                ml_confidence=ml_confidence
             )
             
             # Update scoring result with detected pattern
@@ -302,7 +684,7 @@ class Orchestrator:
             )
             
             # Create analysis result
-            analysis_duration_ms = (time.time() - start_time) * 1000
+            analysis_duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
             
             analysis = AnalysisResult(
                 token=token_data,
@@ -318,112 +700,178 @@ class Orchestrator:
                 f"Score: {scoring_result.score_combined:.1f} | "
                 f"Pattern: {pattern} | "
                 f"Risk: {scoring_result.risk_level} | "
-                f"Time: {analysis_duration_ms:.0f}ms"
+                f"Time: {analysis_duration_ms}ms"
             )
             
+            # Serialize once for both the database and the alert
+            analysis_dict = analysis.to_dict()
+            
             # Save to database
             try:
-                await self._save_analysis(analysis)
+                await self._save_analysis(analysis_dict)
             except Exception as e:
                 logger.error(f"Failed to save analysis: {e}")
             
             # Check if should alert
-            if self._should_alert(scoring_result):
-                await self._send_alert(analysis)
+            if token_data.address in self._recent_alerts:
+                logger.info(f"Alert for {token_data.symbol} already sent recently, skipping")
+            elif self._should_alert(scoring_result):
+                await self._send_alert(analysis, analysis_dict)
             else:
                 logger.info(f"Token does not meet alert threshold: {scoring_result.score_combined:.1f} < {self.min_alert_score}")
             
+            return analysis
+            
         except Exception as e:
             logger.error(f"Error processing token {token_data.address}: {e}", exc_info=True)
+            return None
     
     async def _run_analyzers(
         self,
         token_address: str,
-        token_data: Optional[Dict[str, Any]] = None
+        token_data: Optional[Dict[str, Any]] = None,
+        dex_data: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        """Run all analyzers in parallel"""
+        """Run all analyzers in parallel; a failed analyzer maps to None"""
         
-        logger = get_logger(__name__)
         logger.debug(f"Running analyzers for {token_address}")
         
-        # Run analyzers in parallel
-        results = await asyncio.gather(
-            self.rugcheck_analyzer.analyze(token_address),
-            self.liquidity_analyzer.analyze(token_address, token_data),
-            self.holder_analyzer.analyze(token_address, token_data),
-            return_exceptions=True
-        )
-        
-        # Unpack results
-        rugcheck_result = results[0] if not isinstance(results[0], Exception) else None
-        liquidity_result = results[1] if not isinstance(results[1], Exception) else None
-        holder_result = results[2] if not isinstance(results[2], Exception) else None
-        
-        # Log any errors
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                analyzer_name = ['RugCheck', 'Liquidity', 'Holder'][i]
-                logger.error(f"{analyzer_name} analyzer failed: {result}")
+        async def run(name, label, analyzer, result_type, compute):
+            """Serve an analyzer from the persistent cache; failures are not stored"""
+            try:
+                return await self.analyzer_cache.get_or_compute(
+                    self.analyzer_cache.make_key(name, token_address, self._analyzer_config_hash),
+                    compute,
+                    result_type,
+                    self._analyzer_cache_ttls[name],
+                    cacheable=lambda result: result is not analyzer.FAILED_RESULT
+                )
+            except Exception as e:
+                logger.error(f"{label} analyzer failed: {e}")
+                return None
         
-        return {
-            'rugcheck': rugcheck_result,
-            'liquidity': liquidity_result,
-            'holders': holder_result
-        }
+        rugcheck, liquidity, holders = await asyncio.gather(
+            run(
+                'rugcheck', 'RugCheck', self.rugcheck_analyzer, RugCheckResult,
+                lambda: self.rugcheck_analyzer.analyze(token_address)
+            ),
+            run(
+                'liquidity', 'Liquidity', self.liquidity_analyzer, LiquidityResult,
+                lambda: self.liquidity_analyzer.analyze(token_address, token_data, dex_data=dex_data)
+            ),
+            run(
+                'holders', 'Holder', self.holder_analyzer, HolderResult,
+                lambda: self.holder_analyzer.analyze(token_address, token_data, dex_data=dex_data)
+            )
+        )
+        return {'rugcheck': rugcheck, 'liquidity': liquidity, 'holders': holders}
     
-    async def _get_ml_score(
-        self,
-        token_data: TokenData,
-        analyzer_results: Dict[str, Any]
-    ) -> Dict[str, float]:
-        """Get ML prediction score"""
+    async def _get_ml_score(self, features: np.ndarray) -> Dict[str, float]:
+        """
+        Get ML prediction score for a feature vector
+        
+        While the bot runs, the vector joins the next ML batch; otherwise it
+        is scored on its own. Scores are reused for near-identical vectors.
+        Never raises: a failed prediction scores 0 with 0 confidence.
+        """
         
         try:
-            # Build feature vector
-            features = self._build_feature_vector(token_data, analyzer_results)
+            key = np.floor(features / _ML_KEY_STEPS).astype(np.int64).tobytes()
+            cached = self._ml_cache.get(key)
+            if cached is not None:
+                return cached
+            
+            loop = asyncio.get_running_loop()
             
             # Get prediction
-            prediction = await asyncio.get_event_loop().run_in_executor(
-                None,
-                self.ml_predictor.predict,
-                features
-            )
+            if self._ml_queue is not None:
+                future = loop.create_future()
+                await self._ml_queue.put((features, future))
+                prediction = await future
+            else:
+                prediction = await loop.run_in_executor(
+                    self._ml_executor,
+                    self.ml_predictor.predict,
+                    features
+                )
             
-            return {
+            result = {
                 'score': prediction.get('score', 0.0) * 100,
                 'confidence': prediction.get('confidence', 0.0)
             }
+            self._ml_cache[key] = result
+            return result
             
         except Exception as e:
-            logger = get_logger(__name__)
             logger.warning(f"ML prediction failed: {e}")
             return {'score': 0.0, 'confidence': 0.0}
     
+    def _ml_batch_limit(self) -> int:
+        """
+        Size at which an ML batch is scored without waiting out ML_BATCH_SECONDS
+        
+        A batch can hold at most one vector per token being processed, so once
+        every in-flight token has queued its vector (a whole wave of a scan
+        cycle) there is nothing left to wait for.
+        """
+        return max(1, min(self.ML_BATCH_SIZE, len(self._inflight)))
+    
+    async def _run_ml_batches(self):
+        """Score queued feature vectors in batches until a None sentinel is queued"""
+        loop = asyncio.get_running_loop()
+        done = False
+        
+        while not done:
+            batch, done = await _collect_batch(self._ml_queue, self._ml_batch_limit, self.ML_BATCH_SECONDS)
+            if not batch:
+                continue
+            
+            try:
+                predictions = await loop.run_in_executor(
+                    self._ml_executor,
+                    self.ml_predictor.predict_batch,
+                    np.vstack([features for features, _ in batch])
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            for (_, future), prediction in zip(batch, predictions):
+                if not future.done():  # The waiting token may have been cancelled
+                    future.set_result(prediction)
+    
     def _build_feature_vector(
         self,
         token_data: TokenData,
         analyzer_results: Dict[str, Any]
-    ) -> Dict[str, float]:
-        """Build feature vector for ML model"""
-        
-        features = {
-            'liquidity_usd': token_data.liquidity_usd,
-            'market_cap': token_data.market_cap,
-            'holders': token_data.holders,
-            'age_seconds': token_data.age_seconds,
-            'price_change_5min': token_data.price_change_5min,
-            'volume_24h': token_data.volume_24h
-        }
+    ) -> np.ndarray:
+        """
+        ML feature vector (FEATURE_ORDER) for a token and its analyzer results
+        
+        Values go straight into one float32 array; no per-token dicts. Slots of
+        analyzers that failed stay 0.
+        """
+        features = np.zeros(N_FEATURES, dtype=np.float32)
+        features[_TOKEN_FEATURE_SLOTS] = (
+            token_data.liquidity_usd or 0.0,
+            token_data.market_cap or 0.0,
+            token_data.holders or 0,
+            token_data.age_seconds or 0,
+            token_data.price_change_5min or 0.0,
+            token_data.volume_24h or 0.0
+        )
         
         if analyzer_results.get('rugcheck'):
-            features['rugcheck_score'] = analyzer_results['rugcheck'].overall_score
-            features['top_10_concentration'] = analyzer_results['rugcheck'].top_10_holders_percent
+            features[FEATURE_INDEX['rugcheck_score']] = analyzer_results['rugcheck'].overall_score
+            features[FEATURE_INDEX['top_10_concentration']] = analyzer_results['rugcheck'].top_10_holders_percent
         
         if analyzer_results.get('liquidity'):
-            features['liquidity_stability'] = analyzer_results['liquidity'].liquidity_stability_score
+            features[FEATURE_INDEX['liquidity_stability']] = analyzer_results['liquidity'].liquidity_stability_score
         
         if analyzer_results.get('holders'):
-            features['distribution_score'] = analyzer_results['holders'].distribution_score
+            features[FEATURE_INDEX['distribution_score']] = analyzer_results['holders'].distribution_score
         
         return features
     
@@ -434,7 +882,6 @@ class Orchestrator:
         self._reset_alert_counter_if_needed()
         
         if self.alerts_sent_today >= self.max_alerts_per_day:
-            logger = get_logger(__name__)
             logger.info(f"Daily alert limit reached ({self.max_alerts_per_day})")
             return False
         
@@ -443,40 +890,43 @@ class Orchestrator:
             return False
         
         # Check ML confidence if ML is used
-        min_ml_confidence = self.config.get_nested('alerts', 'min_ml_confidence', 0.65)
-        if scoring_result.ml_confidence > 0 and scoring_result.ml_confidence < min_ml_confidence:
+        if scoring_result.ml_confidence > 0 and scoring_result.ml_confidence < self._min_ml_confidence:
             return False
         
         # Check category filters
-        category_filters = self.config.get_nested('alerts', 'categories', {})
-        if category_filters:
-            # Normalize category name to match config format
-            category_key = scoring_result.category.lower()
-            category_enabled = category_filters.get(category_key, True)
-            if not category_enabled:
-                return False
+        if self._category_filters and not self._category_filters.get(scoring_result.category, True):
+            return False
         
         return True
     
     def _reset_alert_counter_if_needed(self):
         """Reset alert counter if new day"""
-        current_date = datetime.utcnow().date()
-        last_reset_date = self.last_alert_reset.date()
+        # One monotonic clock read per token until midnight is due; the
+        # wall clock is only consulted then
+        if time.monotonic() < self._next_reset_mono:
+            return
         
-        if current_date > last_reset_date:
+        day = int(time.time() // 86400)
+        if day != self._alert_day:
             self.alerts_sent_today = 0
+            self._alert_day = day
             self.last_alert_reset = datetime.utcnow()
+        self._next_reset_mono = self._next_midnight_mono()
     
-    async def _send_alert(self, analysis: AnalysisResult):
-        """Send alert for qualified token"""
-        
-        logger = get_logger(__name__)
+    @staticmethod
+    def _next_midnight_mono() -> float:
+        """time.monotonic() value at the next UTC midnight"""
+        return time.monotonic() + 86400 - time.time() % 86400
+    
+    async def _send_alert(self, analysis: AnalysisResult, analysis_dict: Dict[str, Any]):
+        """Send alert for qualified token; analysis_dict is analysis.to_dict()"""
         
         try:
-            await self.notification_manager.send_alert(analysis.to_dict())
+            await self.notification_manager.send_alert(analysis_dict)
             
             self.alerts_sent_today += 1
             self.total_alerts_sent += 1
+            self._recent_alerts[analysis.token.address] = True
             
             logger.info(
                 f"🚨 ALERT SENT: {analysis.token.symbol} | "
@@ -488,38 +938,90 @@ class Orchestrator:
         except Exception as e:
             logger.error(f"Failed to send alert: {e}")
     
-    async def _save_analysis(self, analysis: AnalysisResult):
-        """Save analysis result to database"""
+    async def _save_analysis(self, analysis_dict: Dict[str, Any]):
+        """
+        Save analysis result (as AnalysisResult.to_dict()) to database
+        
+        While the bot runs, the analysis is queued and written with others in
+        one batch; otherwise it is written right away.
+        """
         
         try:
-            # Convert to dict and save
-            analysis_dict = analysis.to_dict()
+            if self._save_queue is not None:
+                # Waits only if the flusher has fallen 1000 analyses behind
+                await self._save_queue.put(analysis_dict)
+                return
             
             # Save to database
-            await asyncio.get_event_loop().run_in_executor(
-                None,
+            await asyncio.get_running_loop().run_in_executor(
+                self._db_executor,
                 self.db.save_analysis,
                 analysis_dict
             )
             
         except Exception as e:
-            logger = get_logger(__name__)
             logger.error(f"Failed to save analysis: {e}")
     
+    async def _flush_saves(self):
+        """Write queued analyses in batches until a None sentinel is queued"""
+        loop = asyncio.get_running_loop()
+        done = False
+        
+        while not done:
+            batch, done = await _collect_batch(self._save_queue, self.SAVE_BATCH_SIZE, self.SAVE_FLUSH_SECONDS)
+            if batch:
+                try:
+                    await loop.run_in_executor(self._db_executor, self.db.save_analysis_batch, batch)
+                except Exception as e:
+                    logger.error(f"Failed to save {len(batch)} analyses: {e}")
+    
     async def stop(self):
         """Stop the bot gracefully"""
-        logger = get_logger(__name__)
         logger.info("🛑 Stopping bot...")
         
+        # Score and write out work still queued
+        if self._ml_batch_task is not None:
+            if not self._ml_batch_task.done():
+                await self._ml_queue.put(None)
+                await self._ml_batch_task
+            self._ml_batch_task = None
+            self._ml_queue = None
+        
+        if self._flusher_task is not None:
+            if not self._flusher_task.done():
+                await self._save_queue.put(None)
+                await self._flusher_task
+            self._flusher_task = None
+            self._save_queue = None
+        
         # Close scanner connections
-        try:
-            await self.pumpfun_scanner.stop()
-        except Exception as e:
-            logger.error(f"Error disconnecting PumpFun: {e}")
+        if self._pumpfun_enabled:
+            try:
+                await self.pumpfun_scanner.stop()
+            except Exception as e:
+                logger.error(f"Error disconnecting PumpFun: {e}")
         
-        try:
-            await self.dexscreener_scanner.stop()
-        except Exception as e:
-            logger.error(f"Error disconnecting DexScreener: {e}")
+        if self._dexscreener_enabled:
+            try:
+                await self.dexscreener_scanner.stop()
+            except Exception as e:
+                logger.error(f"Error disconnecting DexScreener: {e}")
+        
+        # Close analyzer HTTP sessions
+        for analyzer in (self.rugcheck_analyzer, self.liquidity_analyzer, self.holder_analyzer):
+            try:
+                await analyzer.close()
+            except Exception as e:
+                logger.error(f"Error closing {type(analyzer).__name__}: {e}")
+        
+        if self.http_session is not None and not self.http_session.closed:
+            await self.http_session.close()
+        self.http_session = None
+        
+        self.analyzer_cache.close()
+        
+        # Let queued predictions and writes finish without blocking the loop
+        for executor in (self._ml_executor, self._db_executor):
+            await asyncio.to_thread(executor.shutdown, wait=True)
         
         logger.info("✅ Bot stopped")
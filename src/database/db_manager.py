@@ -3,29 +3,60 @@ Database Manager
 """
 
 import json
-from typing import Dict, Any
+from typing import Dict, Any, List
 from datetime import datetime
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, insert
 from sqlalchemy.orm import sessionmaker, Session
+from src.database.models import AnalysisModel, Base
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+def _analysis_row(analysis_data: Dict[str, Any]) -> Dict[str, Any]:
+    """AnalysisModel columns for an AnalysisResult.to_dict() payload"""
+    token = analysis_data.get('token') or {}
+    scoring = analysis_data.get('scoring') or {}
+    analyzed_at = analysis_data.get('analyzed_at')
+    return {
+        'token_address': token.get('address', 'UNKNOWN'),
+        'symbol': token.get('symbol', 'UNKNOWN'),
+        'score_combined': scoring.get('score_combined', 0.0),
+        'analyzed_at': datetime.fromisoformat(analyzed_at) if analyzed_at else datetime.utcnow(),
+        'data': analysis_data
+    }
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Tune each new SQLite connection for frequent small writes
+    
+    WAL lets readers run alongside the writer, and synchronous=NORMAL syncs
+    at checkpoints rather than on every commit (still safe under WAL).
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
 class DatabaseManager:
     """Database manager for SQLite"""
     
     def __init__(self, database_url: str = "sqlite:///data/scanner.db"):
         """Initialize database manager"""
         self.database_url = database_url
-        self.engine = create_engine(database_url)
+        # Analyzer payloads may hold values json cannot encode natively
+        self.engine = create_engine(database_url, json_serializer=lambda obj: json.dumps(obj, default=str))
+        if self.engine.dialect.name == 'sqlite':
+            event.listen(self.engine, 'connect', _set_sqlite_pragmas)
         self.SessionLocal = sessionmaker(bind=self.engine)
+        self._tables_ready = False  # Set once create_tables has run
         
         logger.info(f"Database initialized: {database_url}")
     
     def create_tables(self):
-        """Create all tables"""
-        # TODO: Import models and create tables
+        """Create all tables (existing ones are left alone)"""
         logger.info("Creating database tables...")
+        Base.metadata.create_all(self.engine)
+        self._tables_ready = True
         logger.info("✅ Tables created")
     
     def get_session(self) -> Session:
@@ -39,22 +70,30 @@ class DatabaseManager:
         Args:
             analysis_data: Dictionary containing analysis results
         """
+        self.save_analysis_batch([analysis_data])
+    
+    def save_analysis_batch(self, rows: List[Dict[str, Any]]):
+        """
+        Save several analysis results in one transaction
+        
+        The rows go out as a single executemany INSERT, so a batch costs one
+        statement and one commit however many analyses it holds.
+        
+        Args:
+            rows: Analysis dictionaries, as accepted by save_analysis
+        """
+        if not rows:
+            return
+        
         try:
-            # For now, we'll just log it
-            # In production, this would save to proper database tables
-            
-            token_address = analysis_data.get('token', {}).get('address', 'UNKNOWN')
-            symbol = analysis_data.get('token', {}).get('symbol', 'UNKNOWN')
-            score = analysis_data.get('scoring', {}).get('score_combined', 0)
+            if not self._tables_ready:
+                self.create_tables()
             
-            logger.debug(f"Saved analysis: {symbol} ({token_address}) - Score: {score:.1f}")
+            with self.SessionLocal() as session:
+                session.execute(insert(AnalysisModel), [_analysis_row(row) for row in rows])
+                session.commit()
             
-            # TODO: Implement proper database storage
-            # session = self.get_session()
-            # analysis_model = AnalysisModel(**analysis_data)
-            # session.add(analysis_model)
-            # session.commit()
-            # session.close()
+            logger.debug(f"Saved {len(rows)} analyses")
             
         except Exception as e:
-            logger.error(f"Error saving analysis: {e}")
+            logger.error(f"Error saving {len(rows)} analyses: {e}")
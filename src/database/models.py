@@ -1,7 +1,29 @@
 """Database models"""
 
+from datetime import datetime
+from typing import Any, Dict
+
+from sqlalchemy import JSON, DateTime, Float, Integer, String
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
 # TODO: Add SQLAlchemy models for:
-# - Tokens
 # - Alerts
 # - Trades
 # - ML Training Data
+
+
+class Base(DeclarativeBase):
+    """Declarative base shared by all tables"""
+
+
+class AnalysisModel(Base):
+    """One token analysis, as produced by AnalysisResult.to_dict()"""
+
+    __tablename__ = 'analyses'
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    token_address: Mapped[str] = mapped_column(String(64), index=True)
+    symbol: Mapped[str] = mapped_column(String(32))
+    score_combined: Mapped[float] = mapped_column(Float, default=0.0)
+    analyzed_at: Mapped[datetime] = mapped_column(DateTime, index=True)
+    data: Mapped[Dict[str, Any]] = mapped_column(JSON)  # The full analysis dict
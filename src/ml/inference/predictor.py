@@ -2,52 +2,135 @@
 ML Predictor - Loads and uses ML models for inference
 """
 
+import threading
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 import joblib
+import numpy as np
 
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Model input columns, in the order the models were trained on
+FEATURE_ORDER = (
+    'liquidity_usd',
+    'market_cap',
+    'holders',
+    'age_seconds',
+    'price_change_5min',
+    'volume_24h',
+    'rugcheck_score',
+    'top_10_concentration',
+    'liquidity_stability',
+    'distribution_score'
+)
+N_FEATURES = len(FEATURE_ORDER)
+FEATURE_INDEX = {name: i for i, name in enumerate(FEATURE_ORDER)}
+
+
+def feature_vector(features: Dict[str, float]) -> np.ndarray:
+    """Lay a feature dict out in FEATURE_ORDER; missing features are 0"""
+    return np.fromiter(
+        (features.get(name) or 0.0 for name in FEATURE_ORDER),
+        dtype=np.float32,
+        count=N_FEATURES
+    )
+
+
 class MLPredictor:
-    """ML prediction engine"""
+    """
+    ML prediction engine
+    
+    Models are loaded on first use (see _get), so startup and memory only pay
+    for the models inference actually calls; warm_up() loads the pump
+    predictor ahead of the first token.
+    """
+    
+    MODEL_FILES = {
+        'pump_predictor': 'pump_predictor.pkl',
+        'magnitude_estimator': 'magnitude_estimator.pkl',
+        'rug_detector': 'rug_detector.pkl',
+        'pattern_matcher': 'pattern_matcher.pkl'
+    }
     
     def __init__(self, models_dir: str = "models"):
         """Initialize ML predictor"""
         self.models_dir = Path(models_dir)
-        self.models = {}
+        self.models: Dict[str, Optional[Any]] = {}  # Loaded (or failed, None) models by name
+        self._load_lock = threading.Lock()  # Inference runs on several threads
         
-        # Load pre-trained models
-        self._load_models()
+        if not any((self.models_dir / f).exists() for f in self.MODEL_FILES.values()):
+            logger.warning("⚠️  No pre-trained models found. Run download_pretrained_models.py")
     
-    def _load_models(self):
-        """Load all ML models"""
-        logger.info("Loading ML models...")
+    def _get(self, model_name: str) -> Optional[Any]:
+        """Model by name, loading it on first use (None if unavailable)"""
+        try:
+            return self.models[model_name]
+        except KeyError:
+            pass
         
-        model_files = {
-            'pump_predictor': 'pump_predictor.pkl',
-            'magnitude_estimator': 'magnitude_estimator.pkl',
-            'rug_detector': 'rug_detector.pkl',
-            'pattern_matcher': 'pattern_matcher.pkl'
-        }
+        with self._load_lock:
+            if model_name not in self.models:
+                self.models[model_name] = self._load_model(model_name, self.MODEL_FILES[model_name])
+            return self.models[model_name]
+    
+    def _load_model(self, model_name: str, file_name: str) -> Optional[Any]:
+        """Load one model file, or None if it is missing, unreadable or a mock"""
+        model_path = self.models_dir / file_name
         
-        for model_name, file_name in model_files.items():
-            model_path = self.models_dir / file_name
-            
-            if model_path.exists():
-                try:
-                    self.models[model_name] = joblib.load(model_path)
-                    logger.info(f"✅ Loaded {model_name}")
-                except Exception as e:
-                    logger.warning(f"⚠️  Could not load {model_name}: {e}")
-                    self.models[model_name] = None
-            else:
-                logger.warning(f"⚠️  Model not found: {file_name}")
-                self.models[model_name] = None
+        if not model_path.exists():
+            logger.warning(f"⚠️  Model not found: {file_name}")
+            return None
         
-        if all(v is None for v in self.models.values()):
-            logger.warning("⚠️  No pre-trained models found. Run download_pretrained_models.py")
+        try:
+            model = joblib.load(model_path)
+        except Exception as e:
+            logger.warning(f"⚠️  Could not load {model_name}: {e}")
+            return None
+        
+        # Mocks were fit on random features; their scores must not reach alerts
+        if getattr(model, 'is_mock', False):
+            logger.warning(f"⚠️  {model_name} is a development mock, ignoring it")
+            return None
+        
+        logger.info(f"✅ Loaded {model_name}")
+        return model
+    
+    def predict(self, features: np.ndarray) -> Dict[str, float]:
+        """
+        Pump probability for one feature vector laid out in FEATURE_ORDER
+        
+        Returns {'score': probability, 'confidence': |2p - 1|}: confidence is 0
+        for a coin flip and 1 for a certain call. Both are 0.0 when the pump
+        predictor is not loaded.
+        """
+        return self.predict_batch(features)[0]
+    
+    def predict_batch(self, features: np.ndarray) -> List[Dict[str, float]]:
+        """
+        Pump probabilities for an (n, N_FEATURES) matrix, one dict per row
+        
+        A single predict_proba call covers every row, so the model's per-call
+        overhead is paid once per batch rather than once per token.
+        """
+        X = np.asarray(features, dtype=np.float32).reshape(-1, N_FEATURES)
+        model = self._get('pump_predictor')
+        if model is None:
+            return [{'score': 0.0, 'confidence': 0.0} for _ in range(len(X))]
+        
+        probabilities = model.predict_proba(X)[:, 1]
+        return [
+            {'score': float(p), 'confidence': float(abs(2.0 * p - 1.0))}
+            for p in probabilities
+        ]
+    
+    def warm_up(self):
+        """Load the pump predictor and run one throwaway prediction, so the first real token skips setup costs"""
+        try:
+            self.predict(np.zeros(N_FEATURES, dtype=np.float32))
+        except Exception as e:
+            logger.warning(f"⚠️  ML warm-up failed: {e}")
     
     def predict_pump(self, features: Dict[str, Any]) -> Dict[str, Any]:
         """Predict if token will pump"""
@@ -2,14 +2,24 @@
 Token Data Models - Core data structures for token analysis
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, Any, List, Optional
+import sys
+from dataclasses import dataclass, field, fields
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
+# dataclass(slots=True) needs Python 3.10+; older interpreters fall back to
+# regular instances with a __dict__
+_SLOTS: Dict[str, Any] = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+def _fields_to_dict(obj: Any) -> Dict[str, Any]:
+    """Shallow field dict for a dataclass (slotted ones have no __dict__)"""
+    return {f.name: getattr(obj, f.name) for f in fields(obj)}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class TokenData:
-    """Token data structure for analysis"""
+    """Token data structure for analysis (immutable once scanned)"""
     
     # Basic info
     address: str
@@ -40,10 +50,25 @@ class TokenData:
     
     # Source info
     source: str = "unknown"  # pumpfun, raydium, dexscreener
-    raw_data: Dict[str, Any] = field(default_factory=dict)
+    # Upstream payload, kept for reference only: not compared or hashed
+    raw_data: Dict[str, Any] = field(default_factory=dict, compare=False)
+    
+    # to_dict() result, built on first use
+    _dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
+        """
+        Convert to dictionary
+        
+        The token is immutable, so the dict is built once and shared by every
+        caller (analyzers, database, alerts); do not modify it.
+        """
+        if self._dict is None:
+            object.__setattr__(self, '_dict', self._build_dict())
+        return self._dict
+    
+    def _build_dict(self) -> Dict[str, Any]:
+        """Field dictionary behind to_dict"""
         return {
             'address': self.address,
             'symbol': self.symbol,
@@ -63,9 +88,15 @@ class TokenData:
         }
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class RugCheckResult:
-    """Results from RugCheck.xyz analysis"""
+    """
+    Results from RugCheck.xyz analysis
+    
+    Frozen and hashable: known_risks is stored as a tuple (lists, e.g. from
+    a JSON round trip, are converted) and raw_data, when kept, is left out of
+    comparisons and hashing.
+    """
     
     overall_score: float  # 0-10
     mint_authority_frozen: bool
@@ -73,13 +104,17 @@ class RugCheckResult:
     top_10_holders_percent: float
     lp_locked: bool
     lp_burned: bool
-    known_risks: List[str] = field(default_factory=list)
+    known_risks: Tuple[str, ...] = ()
     is_honeypot: bool = False
     can_sell: bool = True
-    raw_data: Dict[str, Any] = field(default_factory=dict)
+    raw_data: Optional[Dict[str, Any]] = field(default=None, compare=False)
+    
+    def __post_init__(self):
+        if not isinstance(self.known_risks, tuple):
+            object.__setattr__(self, 'known_risks', tuple(self.known_risks))
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class LiquidityResult:
     """Results from liquidity analysis"""
     
@@ -90,10 +125,10 @@ class LiquidityResult:
     price_impact_1k_usd: float = 0.0
     price_impact_5k_usd: float = 0.0
     liquidity_stability_score: float = 0.0  # 0-100
-    raw_data: Dict[str, Any] = field(default_factory=dict)
+    raw_data: Optional[Dict[str, Any]] = field(default=None, compare=False)  # Not compared or hashed
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class HolderResult:
     """Results from holder distribution analysis"""
     
@@ -103,7 +138,7 @@ class HolderResult:
     dev_wallet_percent: float = 0.0
     growth_rate_per_min: float = 0.0
     distribution_score: float = 0.0  # 0-100
-    raw_data: Dict[str, Any] = field(default_factory=dict)
+    raw_data: Optional[Dict[str, Any]] = field(default=None, compare=False)  # Not compared or hashed
 
 
 @dataclass
@@ -162,7 +197,7 @@ class AnalysisResult:
     
     # Metadata
     analyzed_at: datetime = field(default_factory=datetime.utcnow)
-    analysis_duration_ms: float = 0.0
+    analysis_duration_ms: int = 0
     errors: List[str] = field(default_factory=list)
     
     def is_complete(self) -> bool:
@@ -185,9 +220,9 @@ class AnalysisResult:
         """Convert to dictionary"""
         return {
             'token': self.token.to_dict(),
-            'rugcheck': self.rugcheck.__dict__ if self.rugcheck else None,
-            'liquidity': self.liquidity.__dict__ if self.liquidity else None,
-            'holders': self.holders.__dict__ if self.holders else None,
+            'rugcheck': _fields_to_dict(self.rugcheck) if self.rugcheck else None,
+            'liquidity': _fields_to_dict(self.liquidity) if self.liquidity else None,
+            'holders': _fields_to_dict(self.holders) if self.holders else None,
             'scoring': self.scoring.to_dict() if self.scoring else None,
             'analyzed_at': self.analyzed_at.isoformat(),
             'analysis_duration_ms': self.analysis_duration_ms,
@@ -92,6 +92,9 @@ class MessageFormatter:
     def escape_html(text: str) -> str:
         """Escape special HTML characters for Telegram HTML parse mode"""
         text = str(text)
+        # Most symbols and addresses contain nothing to escape
+        if '&' not in text and '<' not in text and '>' not in text:
+            return text
         # Important: Escape & first to avoid double-escaping
         text = text.replace('&', '&amp;')
         text = text.replace('<', '&lt;')
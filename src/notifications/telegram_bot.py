@@ -5,15 +5,25 @@ Handles bot initialization, message sending, and button interactions
 
 import asyncio
 import re
+import time
 from typing import Dict, Any, Optional
 from telegram import Bot, InlineKeyboardButton, InlineKeyboardMarkup, Update
 from telegram.ext import Application, CallbackQueryHandler, ContextTypes
 from telegram.error import TelegramError, TimedOut, NetworkError
 from src.utils.logger import get_logger
+from src.utils.validators import B58_ADDRESS_RE, B58_INVALID_CHARS_RE
 from src.notifications.formatter import MessageFormatter
 
 logger = get_logger(__name__)
 
+_URL_RE = re.compile(
+    r'^https?://'  # http:// or https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain
+    r'localhost|'  # localhost
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # or IP
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+
 
 class TelegramBot:
     """Telegram bot for sending trading alerts"""
@@ -305,10 +315,10 @@ class TelegramBot:
         
         # Remove any invalid characters for URLs
         # Base58 characters are URL-safe, but double-check
-        if not re.match(r'^[1-9A-HJ-NP-Za-km-z]{32,44}$', address):
+        if not B58_ADDRESS_RE.match(address):
             logger.warning(f"Token address contains invalid characters: {address}")
             # Clean it (remove invalid chars)
-            address = re.sub(r'[^1-9A-HJ-NP-Za-km-z]', '', address)
+            address = B58_INVALID_CHARS_RE.sub('', address)
         
         return address
     
@@ -323,15 +333,7 @@ class TelegramBot:
             True if valid, False otherwise
         """
         # First check basic URL structure
-        url_pattern = re.compile(
-            r'^https?://'  # http:// or https://
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain
-            r'localhost|'  # localhost
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # or IP
-            r'(?::\d+)?'  # optional port
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-        
-        if not url_pattern.match(url):
+        if not _URL_RE.match(url):
             return False
         
         # Additional check: Telegram buttons don't accept URLs with certain special chars
@@ -346,13 +348,13 @@ class TelegramBot:
     
     async def _apply_rate_limit(self):
         """Apply rate limiting between messages"""
-        current_time = asyncio.get_event_loop().time()
+        current_time = time.monotonic()
         time_since_last = current_time - self._last_send_time
         
         if time_since_last < self._rate_limit_delay:
             await asyncio.sleep(self._rate_limit_delay - time_since_last)
         
-        self._last_send_time = asyncio.get_event_loop().time()
+        self._last_send_time = time.monotonic()
     
     async def test_connection(self) -> bool:
         """
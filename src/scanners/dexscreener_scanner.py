@@ -6,6 +6,7 @@ import asyncio
 import aiohttp
 from typing import Dict, Any, List, Optional, Callable
 from datetime import datetime
+from src.utils.http import client_timeout, host_slot, read_json, session_scope
 from src.utils.logger import get_logger
 from src.models.token_data import TokenData
 
@@ -37,6 +38,7 @@ class DexScreenerScanner:
         self.running = False
         self.callback = None
         self.seen_tokens = set()
+        self.session: Optional[aiohttp.ClientSession] = None  # Shared session, owned by the caller
         
         logger.info(f"DexScreener Scanner initialized (poll interval: {self.poll_interval}s)")
     
@@ -111,7 +113,7 @@ class DexScreenerScanner:
                     
                     # Apply pre-filters
                     if self.apply_prefilters(token_data):
-                        logger.info(f"✨ New pair detected: {token_data.symbol} ({token_data.address})")
+                        logger.info("✨ New pair detected: %s (%s)", token_data.symbol, token_data.address)
                         detected_tokens.append(token_data)
                         self.seen_tokens.add(token_data.address)
                         
@@ -120,7 +122,7 @@ class DexScreenerScanner:
                             asyncio.create_task(self.callback(token_data))
                     
                 except Exception as e:
-                    logger.error(f"Error parsing pair: {e}")
+                    logger.error("Error parsing pair: %s", e)
                     continue
             
             return detected_tokens
@@ -158,7 +160,7 @@ class DexScreenerScanner:
                     # Check for momentum indicators
                     if self._has_momentum(token_data):
                         if token_data.address not in self.seen_tokens:
-                            logger.info(f"📈 Trending token detected: {token_data.symbol}")
+                            logger.info("📈 Trending token detected: %s", token_data.symbol)
                             trending_tokens.append(token_data)
                             self.seen_tokens.add(token_data.address)
                             
@@ -166,7 +168,7 @@ class DexScreenerScanner:
                                 asyncio.create_task(self.callback(token_data))
                 
                 except Exception as e:
-                    logger.error(f"Error parsing trending pair: {e}")
+                    logger.error("Error parsing trending pair: %s", e)
                     continue
             
             return trending_tokens
@@ -195,16 +197,16 @@ class DexScreenerScanner:
         
         for attempt in range(max_retries):
             try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(
+                async with session_scope(self.session) as session:
+                    async with host_slot(url), session.get(
                         url,
-                        timeout=aiohttp.ClientTimeout(total=10)
+                        timeout=client_timeout(10)
                     ) as response:
                         
                         self.request_count += 1
                         
                         if response.status == 200:
-                            return await response.json()
+                            return await read_json(response)
                         
                         elif response.status == 429:
                             # Rate limited
@@ -299,7 +301,7 @@ class DexScreenerScanner:
             )
             
         except Exception as e:
-            logger.error(f"Error parsing pair data: {e}")
+            logger.error("Error parsing pair data: %s", e)
             return None
     
     def apply_prefilters(self, token_data: TokenData) -> bool:
@@ -7,6 +7,7 @@ import websockets
 import json
 from typing import Dict, Any, List, Optional, Callable
 from datetime import datetime
+from src.utils.http import json_loads
 from src.utils.logger import get_logger
 from src.models.token_data import TokenData
 
@@ -101,7 +102,7 @@ class PumpFunScanner:
                 )
                 
                 # Parse the message
-                data = json.loads(message)
+                data = json_loads(message)
                 
                 # Check if it's a new token event
                 if self._is_new_token_event(data):
@@ -172,26 +173,26 @@ class PumpFunScanner:
         
         # Liquidity check
         if token_data.liquidity_usd < self.liquidity_min:
-            logger.debug(f"Filtered: Liquidity too low (${token_data.liquidity_usd})")
+            logger.debug("Filtered: Liquidity too low ($%s)", token_data.liquidity_usd)
             return False
         
         if token_data.liquidity_usd > self.liquidity_max:
-            logger.debug(f"Filtered: Liquidity too high (${token_data.liquidity_usd})")
+            logger.debug("Filtered: Liquidity too high ($%s)", token_data.liquidity_usd)
             return False
         
         # Age check
         if token_data.age_seconds > self.age_max_seconds:
-            logger.debug(f"Filtered: Token too old ({token_data.age_seconds}s)")
+            logger.debug("Filtered: Token too old (%ss)", token_data.age_seconds)
             return False
         
         # Holders check
         if token_data.holders > 0 and token_data.holders < self.holders_min:
-            logger.debug(f"Filtered: Not enough holders ({token_data.holders})")
+            logger.debug("Filtered: Not enough holders (%s)", token_data.holders)
             return False
         
         # Market cap check
         if token_data.market_cap > self.market_cap_max:
-            logger.debug(f"Filtered: Market cap too high (${token_data.market_cap})")
+            logger.debug("Filtered: Market cap too high ($%s)", token_data.market_cap)
             return False
         
         return True
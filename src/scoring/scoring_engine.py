@@ -2,8 +2,9 @@
 Scoring Engine - Combines rule-based and ML scores with professional weights
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Sequence, Tuple
 import numpy as np
+from src.utils.jit import NUMBA_AVAILABLE, njit
 from src.utils.logger import get_logger
 from src.models.token_data import (
     TokenData, RugCheckResult, LiquidityResult, 
@@ -12,6 +13,64 @@ from src.models.token_data import (
 
 logger = get_logger(__name__)
 
+# Rule weights in component order: security, liquidity, holder, momentum,
+# social, age
+RULE_WEIGHTS = np.array([0.30, 0.20, 0.15, 0.20, 0.10, 0.05])
+
+
+@njit(cache=True)
+def _combine_scores(
+    security_score: float,
+    liquidity_score: float,
+    holder_score: float,
+    momentum_score: float,
+    social_score: float,
+    age_score: float,
+    ml_score: float,
+    ml_confidence: float,
+    rule_weight: float,
+    ml_weight: float
+):
+    """
+    Rule-based scoring with professional weights, blended with the ML score
+    
+    Formula:
+    score_rules = (
+        security_score * 0.30 +      # 30% - Security is critical
+        liquidity_score * 0.20 +     # 20% - Adequate liquidity
+        holder_score * 0.15 +        # 15% - Distribution
+        momentum_score * 0.20 +      # 20% - Price action
+        social_score * 0.10 +        # 10% - Social signals
+        age_score * 0.05             # 5% - Not too old/new
+    ) * 100
+    
+    Returns (rule_score, combined_score, ml_score, ml_confidence). ML inputs
+    are zeroed when the model is not confident enough to be blended in.
+    Compiled with numba when available; the compiled code is cached on disk.
+    """
+    rule_score = (
+        security_score * RULE_WEIGHTS[0] +
+        liquidity_score * RULE_WEIGHTS[1] +
+        holder_score * RULE_WEIGHTS[2] +
+        momentum_score * RULE_WEIGHTS[3] +
+        social_score * RULE_WEIGHTS[4] +
+        age_score * RULE_WEIGHTS[5]
+    ) * 100
+    rule_score = min(100.0, max(0.0, rule_score))
+    
+    if ml_score > 0 and ml_confidence >= 0.50:
+        # Use ML score if available and confident
+        combined_score = (rule_score * rule_weight) + (ml_score * ml_weight)
+        return rule_score, combined_score, ml_score, ml_confidence
+    
+    # Use only rule-based score
+    return rule_score, rule_score, 0.0, 0.0
+
+
+def warm_up():
+    """Compile the scoring kernel ahead of the first real scan"""
+    _combine_scores(0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.0, 0.0, 0.6, 0.4)
+
 
 class ScoringEngine:
     """Main scoring engine combining multiple scoring methods"""
@@ -45,33 +104,29 @@ class ScoringEngine:
         """
         
         # Calculate individual component scores
-        security_score = self._calculate_security_score(rugcheck)
-        liquidity_score = self._calculate_liquidity_score(liquidity, token)
-        holder_score = self._calculate_holder_score(holders)
-        momentum_score = self._calculate_momentum_score(token)
-        social_score = self._calculate_social_score(token)
-        age_score = self._calculate_age_score(token)
-        
-        # Calculate rule-based score with professional weights
-        rule_score = self._calculate_rule_score(
-            security_score=security_score,
-            liquidity_score=liquidity_score,
-            holder_score=holder_score,
-            momentum_score=momentum_score,
-            social_score=social_score,
-            age_score=age_score
+        (
+            security_score,
+            liquidity_score,
+            holder_score,
+            momentum_score,
+            social_score,
+            age_score
+        ) = self._component_scores(token, rugcheck, liquidity, holders)
+        
+        # Calculate rule-based and combined scores
+        rule_score, combined_score, ml_score, ml_confidence = _combine_scores(
+            float(security_score),
+            float(liquidity_score),
+            float(holder_score),
+            float(momentum_score),
+            float(social_score),
+            float(age_score),
+            float(ml_score),
+            float(ml_confidence),
+            float(self.rule_weight),
+            float(self.ml_weight)
         )
         
-        # Calculate combined score
-        if ml_score > 0 and ml_confidence >= 0.50:
-            # Use ML score if available and confident
-            combined_score = (rule_score * self.rule_weight) + (ml_score * self.ml_weight)
-        else:
-            # Use only rule-based score
-            combined_score = rule_score
-            ml_score = 0.0
-            ml_confidence = 0.0
-        
         # Determine category and risk level
         category = self._categorize_score(combined_score, token, rugcheck)
         risk_level = self._determine_risk_level(category, rugcheck, security_score)
@@ -92,39 +147,63 @@ class ScoringEngine:
             ml_confidence=ml_confidence
         )
     
-    def _calculate_rule_score(
+    def calculate_score_batch(
         self,
-        security_score: float,
-        liquidity_score: float,
-        holder_score: float,
-        momentum_score: float,
-        social_score: float,
-        age_score: float
-    ) -> float:
-        """
-        Rule-based scoring with professional weights
-        
-        Formula:
-        score_rules = (
-            security_score * 0.30 +      # 30% - Security is critical
-            liquidity_score * 0.20 +     # 20% - Adequate liquidity
-            holder_score * 0.15 +        # 15% - Distribution
-            momentum_score * 0.20 +      # 20% - Price action
-            social_score * 0.10 +        # 10% - Social signals
-            age_score * 0.05             # 5% - Not too old/new
-        ) * 100
+        tokens: Sequence[TokenData],
+        rugchecks: Optional[Sequence[Optional[RugCheckResult]]] = None,
+        liquidities: Optional[Sequence[Optional[LiquidityResult]]] = None,
+        holders: Optional[Sequence[Optional[HolderResult]]] = None,
+        ml_scores: Optional[Sequence[float]] = None,
+        ml_confidences: Optional[Sequence[float]] = None
+    ) -> np.ndarray:
         """
+        Calculate combined scores (0-100) for many tokens at once
         
-        score = (
-            security_score * 0.30 +
-            liquidity_score * 0.20 +
-            holder_score * 0.15 +
-            momentum_score * 0.20 +
-            social_score * 0.10 +
-            age_score * 0.05
-        ) * 100
-        
-        return min(100.0, max(0.0, score))
+        Component scores are stacked into an (N, 6) matrix and weighted with a
+        single matrix-vector product instead of one kernel call per token.
+        Entry i matches calculate_score(...).score_combined for token i.
+        """
+        n = len(tokens)
+        rugchecks = rugchecks if rugchecks is not None else [None] * n
+        liquidities = liquidities if liquidities is not None else [None] * n
+        holders = holders if holders is not None else [None] * n
+        
+        components = np.array(
+            [
+                self._component_scores(token, rugcheck, liquidity, holder)
+                for token, rugcheck, liquidity, holder
+                in zip(tokens, rugchecks, liquidities, holders)
+            ],
+            dtype=np.float64
+        ).reshape(n, len(RULE_WEIGHTS))
+        rule_scores = np.clip((components @ RULE_WEIGHTS) * 100, 0.0, 100.0)
+        
+        ml = np.zeros(n) if ml_scores is None else np.asarray(ml_scores, dtype=np.float64)
+        confidence = np.zeros(n) if ml_confidences is None else np.asarray(ml_confidences, dtype=np.float64)
+        use_ml = (ml > 0) & (confidence >= 0.50)
+        
+        return np.where(
+            use_ml,
+            rule_scores * self.rule_weight + ml * self.ml_weight,
+            rule_scores
+        )
+    
+    def _component_scores(
+        self,
+        token: TokenData,
+        rugcheck: Optional[RugCheckResult],
+        liquidity: Optional[LiquidityResult],
+        holders: Optional[HolderResult]
+    ) -> Tuple[float, float, float, float, float, float]:
+        """Component scores (0-1) in RULE_WEIGHTS order"""
+        return (
+            self._calculate_security_score(rugcheck),
+            self._calculate_liquidity_score(liquidity, token),
+            self._calculate_holder_score(holders),
+            self._calculate_momentum_score(token),
+            self._calculate_social_score(token),
+            self._calculate_age_score(token)
+        )
     
     def _calculate_security_score(self, rugcheck: Optional[RugCheckResult]) -> float:
         """Calculate security score (0-1)"""
@@ -0,0 +1,167 @@
+"""
+Persistent analyzer result cache keyed by SHA-256
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Type, TypeVar
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar('T')
+
+CACHE_POLICIES = ('enabled', 'read-only', 'write-only', 'replay', 'disabled')
+
+# Stored results are committed together once this many are pending, or on the
+# first write this many seconds after the last commit
+WRITE_BATCH_SIZE = 32
+WRITE_FLUSH_SECONDS = 1.0
+
+
+def config_hash(config: Dict[str, Any]) -> str:
+    """Stable digest of a config dict, so changed settings miss old entries"""
+    return hashlib.sha256(json.dumps(config, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class AnalyzerCache:
+    """
+    SQLite-backed cache of analyzer results that survives restarts
+
+    Entries are keyed by sha256(analyzer|token|config hash). The policy
+    decides how the cache is used:
+    - enabled: serve entries younger than their TTL, store new results
+    - read-only: serve entries younger than their TTL, never write
+    - write-only: always compute and store, e.g. to record a session for
+      later replay
+    - replay: serve stored entries whatever their age and store misses,
+      for reproducible development runs
+    - disabled: always compute
+    SQLite work runs in a worker thread so the event loop never blocks on it.
+    Writes are buffered and committed in batches (see WRITE_BATCH_SIZE), and
+    close() commits whatever is still pending.
+    """
+
+    def __init__(self, path: str = "data/analyzer_cache.db", policy: str = "enabled"):
+        """Initialize cache (the database is opened on first use)"""
+        if policy not in CACHE_POLICIES:
+            raise ValueError(f"Unknown cache policy {policy!r}, expected one of {CACHE_POLICIES}")
+
+        self.path = Path(path)
+        self.policy = policy
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()  # One connection, shared by worker threads
+        self._pending: Dict[str, Tuple[str, float]] = {}  # key -> (payload_json, inserted_at), uncommitted
+        self._last_flush = time.monotonic()
+
+    @staticmethod
+    def make_key(analyzer_name: str, token_address: str, config_digest: str) -> str:
+        """Cache key for one analyzer's result on one token"""
+        return hashlib.sha256(f"{analyzer_name}|{token_address}|{config_digest}".encode()).hexdigest()
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[T]],
+        result_type: Type[T],
+        ttl: float,
+        cacheable: Callable[[T], bool] = lambda result: True
+    ) -> T:
+        """
+        Return the stored result for key, or await compute() and store it
+
+        result_type is the dataclass stored results are rebuilt into. Results
+        for which cacheable() is False (e.g. failure placeholders) are returned
+        but not stored. Cache errors are logged and treated as misses.
+        """
+        if self.policy == 'disabled':
+            return await compute()
+
+        if self.policy != 'write-only':
+            max_age = None if self.policy == 'replay' else ttl
+            try:
+                payload = await asyncio.to_thread(self._read, key, max_age)
+                if payload is not None:
+                    return result_type(**payload)
+            except Exception as e:
+                logger.warning("Analyzer cache read failed: %s", e)
+
+        result = await compute()
+
+        if self.policy != 'read-only' and result is not None and cacheable(result):
+            try:
+                await asyncio.to_thread(self._write, key, asdict(result))
+            except Exception as e:
+                logger.warning("Analyzer cache write failed: %s", e)
+
+        return result
+
+    def close(self):
+        """Commit pending writes and close the database connection"""
+        with self._lock:
+            try:
+                self._flush()
+            except Exception as e:
+                logger.warning("Analyzer cache flush failed: %s", e)
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database and create the table on first use (lock held)"""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS analyzer_cache ("
+                "key TEXT PRIMARY KEY, payload_json TEXT NOT NULL, inserted_at REAL NOT NULL)"
+            )
+        return self._conn
+
+    def _read(self, key: str, max_age: Optional[float]) -> Optional[Dict[str, Any]]:
+        """Stored payload for key, or None if missing or older than max_age"""
+        with self._lock:
+            row = self._pending.get(key) or self._connection().execute(
+                "SELECT payload_json, inserted_at FROM analyzer_cache WHERE key = ?",
+                (key,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        payload_json, inserted_at = row
+        # Wall-clock time: entries outlive the process that wrote them
+        if max_age is not None and time.time() - inserted_at >= max_age:
+            return None
+        return json.loads(payload_json)
+
+    def _write(self, key: str, payload: Dict[str, Any]):
+        """Insert or replace the payload for key (committed with its batch)"""
+        payload_json = json.dumps(payload, default=str)
+        with self._lock:
+            self._pending[key] = (payload_json, time.time())
+            if (
+                len(self._pending) >= WRITE_BATCH_SIZE
+                or time.monotonic() - self._last_flush >= WRITE_FLUSH_SECONDS
+            ):
+                self._flush()
+
+    def _flush(self):
+        """Commit pending writes in one transaction (lock held)"""
+        if self._pending:
+            conn = self._connection()
+            conn.executemany(
+                "INSERT OR REPLACE INTO analyzer_cache (key, payload_json, inserted_at) VALUES (?, ?, ?)",
+                [(key, payload_json, inserted_at) for key, (payload_json, inserted_at) in self._pending.items()]
+            )
+            conn.commit()
+            self._pending.clear()
+        self._last_flush = time.monotonic()
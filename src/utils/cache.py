@@ -0,0 +1,117 @@
+"""
+Bounded in-memory caches
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Least-recently-used cache whose entries expire after ttl seconds
+
+    Holds at most maxsize entries; inserting past that evicts the least
+    recently used one, so memory stays flat on long-running scans. hits and
+    misses count get() outcomes, for reporting hit rates.
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: float = 30):
+        """Initialize cache"""
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Return a live entry (marking it recently used) or default"""
+        item = self._data.get(key)
+        if item is None:
+            self.misses += 1
+            return default
+
+        value, expires_at = item
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any):
+        self.set(key, value)
+    
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """Store an entry that expires after ttl seconds (default: the cache's ttl)"""
+        self._data[key] = (value, time.monotonic() + (self.ttl if ttl is None else ttl))
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def pop(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Remove an entry and return its value (or default)"""
+        item = self._data.pop(key, None)
+        return default if item is None else item[0]
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of get() calls answered from the cache (0.0 before any)"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self):
+        """Drop every entry"""
+        self._data.clear()
+
+
+_MISSING = object()
+
+
+class AdaptiveTTL:
+    """
+    Per-key TTLs that follow how often each key's data actually changes
+    
+    observe() compares a cheap digest of freshly fetched data with the one
+    seen last time: while it stays the same the key's TTL grows by growth up
+    to ceiling; when it changes the TTL drops back to floor. Keys seen for
+    the first time get initial.
+    """
+
+    def __init__(
+        self,
+        initial: float = 30,
+        floor: float = 10,
+        ceiling: float = 300,
+        growth: float = 2.0,
+        maxsize: int = 10000
+    ):
+        """Initialize TTL tracker"""
+        self.initial = initial
+        self.floor = floor
+        self.ceiling = ceiling
+        self.growth = growth
+        # (digest, ttl) per key; kept well past ceiling so the state outlives
+        # the cached value it describes
+        self._state = TTLCache(maxsize=maxsize, ttl=ceiling * 2)
+
+    def observe(self, key: Hashable, digest: Hashable) -> float:
+        """Record the latest digest for key and return the TTL to cache it with"""
+        previous = self._state.get(key)
+        if previous is None:
+            ttl = self.initial
+        elif previous[0] == digest:
+            ttl = min(self.ceiling, previous[1] * self.growth)
+        else:
+            ttl = self.floor
+
+        self._state[key] = (digest, ttl)
+        return ttl
@@ -0,0 +1,115 @@
+"""
+DexScreener batch resolver - fetch many tokens per request
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+
+from src.utils.cache import TTLCache
+from src.utils.http import client_timeout, host_slot, read_json, session_scope
+from src.utils.logger import get_logger
+from src.utils.shared_cache import slim_dex_response
+
+logger = get_logger(__name__)
+
+
+class DexScreenerBatch:
+    """
+    Resolve DexScreener pair data for many tokens at once
+
+    The tokens endpoint accepts up to 30 comma-separated addresses, so a scan
+    cycle needs ceil(N/30) requests instead of one per token per analyzer.
+    Results are shaped like the single-token response ({'pairs': [...]}),
+    trimmed to each token's main pair, so analyzers can consume them unchanged.
+    """
+
+    BASE_URL = "https://api.dexscreener.com/latest/dex/tokens"
+    MAX_ADDRESSES = 30
+
+    def __init__(
+        self,
+        session: Optional[aiohttp.ClientSession] = None,
+        timeout: int = 10,
+        cache_ttl: int = 30
+    ):
+        """Initialize batch resolver"""
+        self.session = session  # Shared session, owned by the caller
+        self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self.cache = TTLCache(maxsize=10000, ttl=cache_ttl)
+
+    async def get_many(
+        self,
+        addresses: List[str],
+        session: Optional[aiohttp.ClientSession] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch pair data for every address
+
+        Returns a dict mapping each requested address to {'pairs': [...]}.
+        Addresses DexScreener knows nothing about map to an empty pair list;
+        addresses whose chunk failed to download are left out. session
+        overrides the one given at construction for this call.
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        missing = []
+
+        for address in dict.fromkeys(addresses):
+            cached = self.cache.get(address)
+            if cached is not None:
+                results[address] = cached
+            else:
+                missing.append(address)
+
+        if not missing:
+            return results
+
+        chunks = [
+            missing[i:i + self.MAX_ADDRESSES]
+            for i in range(0, len(missing), self.MAX_ADDRESSES)
+        ]
+
+        async with session_scope(session or self.session) as session:
+            responses = await asyncio.gather(
+                *(self._fetch_chunk(session, chunk) for chunk in chunks),
+                return_exceptions=True
+            )
+
+        for chunk, response in zip(chunks, responses):
+            if isinstance(response, Exception) or response is None:
+                logger.warning("DexScreener batch lookup failed for %d tokens: %s", len(chunk), response)
+                continue
+
+            # Index pairs by their base token; a token can trade in many pairs
+            pairs_by_address: Dict[str, List[Dict[str, Any]]] = {address: [] for address in chunk}
+            for pair in response.get('pairs') or []:
+                base_address = pair.get('baseToken', {}).get('address')
+                if base_address in pairs_by_address:
+                    pairs_by_address[base_address].append(pair)
+
+            for address, pairs in pairs_by_address.items():
+                data = slim_dex_response(pairs)
+                self.cache[address] = data
+                results[address] = data
+
+        return results
+
+    async def _fetch_chunk(
+        self,
+        session: aiohttp.ClientSession,
+        chunk: List[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch one comma-separated batch of addresses"""
+        url = f"{self.BASE_URL}/{','.join(chunk)}"
+
+        async with host_slot(url), session.get(
+            url,
+            timeout=client_timeout(self.timeout)
+        ) as response:
+            if response.status == 200:
+                return await read_json(response)
+
+            logger.warning("DexScreener batch API returned status %d", response.status)
+            return None
@@ -0,0 +1,93 @@
+"""
+HTTP helpers shared by scanners and analyzers
+"""
+
+import asyncio
+import weakref
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from src.utils.rate_limiter import throttle
+
+# orjson decodes straight from bytes and is several times faster than the
+# stdlib on API payloads; fall back transparently when it is not installed
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    import json
+    json_loads = json.loads
+
+# Concurrent requests allowed per upstream host, across all callers
+MAX_REQUESTS_PER_HOST = 8
+
+# Semaphores belong to the loop they first wait on, so they are kept per loop
+_host_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+@asynccontextmanager
+async def session_scope(session: Optional[aiohttp.ClientSession] = None) -> AsyncIterator[aiohttp.ClientSession]:
+    """
+    Yield an aiohttp session for a single request
+
+    If a shared session was injected it is yielded as-is and left open for
+    the owner to close. Otherwise a short-lived session is created and closed
+    on exit.
+    """
+    if session is not None:
+        yield session
+        return
+
+    async with aiohttp.ClientSession() as owned_session:
+        yield owned_session
+
+
+@lru_cache(maxsize=None)
+def client_timeout(total: float) -> aiohttp.ClientTimeout:
+    """
+    Shared ClientTimeout for a total budget in seconds
+    
+    Connection setup is capped at 3 seconds so a dead host fails fast.
+    ClientTimeout is immutable, so one instance per budget is reused instead
+    of allocating a new one per request.
+    """
+    return aiohttp.ClientTimeout(total=total, connect=min(total, 3))
+
+
+async def read_json(response: aiohttp.ClientResponse) -> Any:
+    """Decode a JSON response body from raw bytes"""
+    return json_loads(await response.read())
+
+
+def host_semaphore(url: str) -> asyncio.Semaphore:
+    """
+    Semaphore bounding concurrent requests to the host of url
+    
+    Every analyzer hitting the same API shares one limit, so a burst of scans
+    queues locally instead of tripping the upstream rate limiter (429s).
+    """
+    semaphores = _host_semaphores.setdefault(asyncio.get_running_loop(), {})
+    host = urlsplit(url).netloc
+    semaphore = semaphores.get(host)
+    if semaphore is None:
+        semaphore = semaphores[host] = asyncio.Semaphore(MAX_REQUESTS_PER_HOST)
+    return semaphore
+
+
+@asynccontextmanager
+async def host_slot(url: str) -> AsyncIterator[None]:
+    """
+    Hold a request slot for url's host
+    
+    Bounds concurrency with host_semaphore and, once a slot is free, waits
+    for the host's requests-per-minute budget (see rate_limiter).
+    """
+    async with host_semaphore(url):
+        await throttle(url)
+        yield
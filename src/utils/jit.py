@@ -0,0 +1,19 @@
+"""
+Optional numba JIT support
+
+Exposes njit/prange from numba when it is installed, and pure-Python
+stand-ins otherwise so decorated kernels still run (just slower).
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback no-op decorator when numba is not installed"""
+        def decorator(func):
+            return func
+        return decorator
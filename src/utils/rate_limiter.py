@@ -0,0 +1,66 @@
+"""
+Token-bucket rate limiting for upstream APIs
+"""
+
+import asyncio
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+# Requests per minute allowed per API host unless config overrides them
+DEFAULT_HOST_RPM: Dict[str, float] = {
+    'api.dexscreener.com': 300,
+    'api.rugcheck.xyz': 60
+}
+
+# Buckets by host; hosts without one are not rate limited
+_host_buckets: Dict[str, "TokenBucket"] = {}
+
+
+class TokenBucket:
+    """
+    Requests-per-minute limiter
+
+    The bucket holds up to burst tokens and refills at rpm/60 per second;
+    each request takes one. A caller that finds it empty reserves its token
+    anyway and sleeps exactly until the refill covers it, so waiters are
+    served in arrival order and requests are spread out instead of piling
+    into 429 responses and retry backoff.
+    """
+
+    def __init__(self, rpm: float, burst: Optional[float] = None):
+        """Initialize bucket (full; burst defaults to one minute's worth)"""
+        if rpm <= 0:
+            raise ValueError(f"rpm must be positive, got {rpm}")
+
+        self.rpm = rpm
+        self.burst = burst if burst is not None else rpm
+        self.tokens = self.burst
+        self.last_update = time.monotonic()
+
+    async def acquire(self, cost: float = 1.0):
+        """Take cost tokens, waiting for the refill if the bucket is short"""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.last_update) * self.rpm / 60)
+        self.last_update = now
+
+        # Reserve before sleeping; a negative balance queues later callers
+        # behind this one
+        self.tokens -= cost
+        if self.tokens < 0:
+            await asyncio.sleep(-self.tokens * 60 / self.rpm)
+
+
+def set_host_rate_limit(host: str, rpm: Optional[float]):
+    """Limit requests to host to rpm per minute (None or 0 removes the limit)"""
+    if rpm:
+        _host_buckets[host] = TokenBucket(rpm)
+    else:
+        _host_buckets.pop(host, None)
+
+
+async def throttle(url: str):
+    """Wait for a request slot under the rate limit of url's host, if it has one"""
+    bucket = _host_buckets.get(urlsplit(url).netloc)
+    if bucket is not None:
+        await bucket.acquire()
@@ -0,0 +1,91 @@
+"""
+Process-wide response caches shared by analyzers
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+
+from src.utils.cache import TTLCache
+from src.utils.http import client_timeout, host_slot, read_json, session_scope
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEXSCREENER_TOKENS_URL = "https://api.dexscreener.com/latest/dex/tokens"
+
+# Parsed DexScreener token responses, shared so the holder and liquidity
+# analyzers fetch and decode each token once
+DEX_RESPONSE_CACHE = TTLCache(maxsize=50000, ttl=20)
+
+# Futures for lookups currently on the wire, keyed by address
+_in_flight: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+
+
+def slim_dex_response(pairs: Optional[List[Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    Keep only the main pair of a DexScreener token response
+    
+    Analyzers read nothing past pairs[0], and a popular token's response can
+    list dozens of pairs; dropping the rest keeps cached entries small.
+    """
+    return {'pairs': list(pairs[:1]) if pairs else []}
+
+
+async def get_dex(
+    token_address: str,
+    session: Optional[aiohttp.ClientSession] = None,
+    timeout: int = 10
+) -> Dict[str, Any]:
+    """
+    Fetch the DexScreener response for a token, cached and coalesced
+
+    Concurrent callers asking for the same address await a single request.
+    Only the main pair is kept (see slim_dex_response). Returns {} when DexScreener answers with a non-200 status; network
+    errors are raised to every waiting caller.
+    """
+    cached = DEX_RESPONSE_CACHE.get(token_address)
+    if cached is not None:
+        return cached
+
+    pending = _in_flight.get(token_address)
+    if pending is not None:
+        return await asyncio.shield(pending)
+
+    future = asyncio.get_running_loop().create_future()
+    _in_flight[token_address] = future
+    try:
+        data = await _fetch(token_address, session, timeout)
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # Mark retrieved so lone failures are not logged twice
+        raise
+    else:
+        if data:
+            DEX_RESPONSE_CACHE[token_address] = data
+        future.set_result(data)
+        return data
+    finally:
+        _in_flight.pop(token_address, None)
+
+
+async def _fetch(
+    token_address: str,
+    session: Optional[aiohttp.ClientSession],
+    timeout: int
+) -> Dict[str, Any]:
+    """Issue the DexScreener request"""
+    url = f"{DEXSCREENER_TOKENS_URL}/{token_address}"
+
+    async with session_scope(session) as active_session:
+        async with host_slot(url), active_session.get(
+            url,
+            timeout=client_timeout(timeout)
+        ) as response:
+            if response.status == 200:
+                data = await read_json(response)
+                return slim_dex_response(data.get('pairs'))
+
+            logger.warning("DexScreener API returned status %d", response.status)
+            return {}
@@ -0,0 +1,15 @@
+"""
+Validation helpers shared across scanners, analyzers and notifications
+"""
+
+import re
+
+# Solana addresses are base58 encoded, 32-44 characters
+# Valid characters: 1-9, A-H, J-N, P-Z, a-k, m-z (no 0, O, I, l)
+B58_ADDRESS_RE = re.compile(r'^[1-9A-HJ-NP-Za-km-z]{32,44}$')
+B58_INVALID_CHARS_RE = re.compile(r'[^1-9A-HJ-NP-Za-km-z]')
+
+
+def is_valid_address(address: str) -> bool:
+    """Check that a string looks like a Solana base58 address"""
+    return bool(address) and B58_ADDRESS_RE.match(address) is not None
@@ -0,0 +1,251 @@
+"""Tests for analyzer modules"""
+
+import pytest
+
+from src.analyzers.holder_analyzer import HolderAnalyzer
+from src.analyzers.liquidity_analyzer import LiquidityAnalyzer
+from src.analyzers.rugcheck_analyzer import RugCheckAnalyzer
+
+
+@pytest.mark.parametrize("holders, top10, dev, expected", [
+    (1000, 20.0, 5.0, 100.0),   # Best bucket on every component
+    (999, 20.5, 5.5, 35.0 + 30.0 + 15.0),
+    (500, 30.0, 10.0, 35.0 + 30.0 + 15.0),
+    (200, 40.0, 15.0, 30.0 + 20.0 + 10.0),
+    (100, 50.0, 20.0, 25.0 + 10.0 + 5.0),
+    (50, 50.1, 20.1, 20.0),
+    (20, 100.0, 50.0, 10.0),
+    (19, 100.0, 50.0, 0.0),
+])
+def test_distribution_score_buckets(holders, top10, dev, expected):
+    """Bucket boundaries match the documented point ladder"""
+    analyzer = HolderAnalyzer()
+    assert analyzer._calculate_distribution_score(holders, top10, dev) == pytest.approx(expected)
+
+
+
+@pytest.mark.parametrize("liquidity, secured, impact, expected", [
+    (100000, 100.0, 0.5, 100.0),  # Best bucket on every component
+    (99999, 0.0, 1.0, 30.0 + 15.0),
+    (20000, 50.0, 3.0, 20.0 + 20.0 + 10.0),
+    (10000, 0.0, 9.9, 10.0 + 5.0),
+    (9999, 0.0, 10.0, 0.0),
+])
+def test_stability_score_buckets(liquidity, secured, impact, expected):
+    """Stability ladder boundaries match the documented point ladder"""
+    analyzer = LiquidityAnalyzer()
+    assert analyzer._calculate_stability_score(liquidity, secured, 0.0, impact) == pytest.approx(expected)
+
+def test_analyze_many_matches_scalar_analyze():
+    """Batch holder analysis produces the same results as per-token calls"""
+    import asyncio
+    
+    dex_data_map = {
+        'AAA': {'pairs': [{'info': {'holders': 1500}}]},
+        'BBB': {'pairs': [{'info': {'holders': 120}}]},
+        'CCC': {'pairs': []},
+    }
+    token_data_map = {'CCC': {'holders': 30, 'holder_growth_rate': 2.5}}
+    
+    class FakeBatch:
+        async def get_many(self, addresses, session=None):
+            return {address: dex_data_map[address] for address in addresses}
+    
+    async def run():
+        batch_analyzer = HolderAnalyzer()
+        batch_analyzer.dex_batch = FakeBatch()
+        batch = await batch_analyzer.analyze_many(list(dex_data_map), token_data_map)
+        await batch_analyzer.close()
+        
+        scalar_analyzer = HolderAnalyzer()
+        scalar = {
+            address: await scalar_analyzer.analyze(
+                address,
+                token_data_map.get(address),
+                dex_data=dex_data
+            )
+            for address, dex_data in dex_data_map.items()
+        }
+        return batch, scalar
+    
+    batch, scalar = asyncio.run(run())
+    
+    assert batch == scalar
+    assert batch['AAA'].distribution_score == pytest.approx(100.0)
+
+
+def test_liquidity_analyze_many_matches_scalar_analyze():
+    """Batch liquidity analysis produces the same results as per-token calls"""
+    import asyncio
+    
+    dex_data_map = {
+        'AAA': {'pairs': [{'liquidity': {'usd': 120000}}]},
+        'BBB': {'pairs': [{'liquidity': {'usd': 8000, 'locked': 50}}]},
+        'CCC': {'pairs': []},
+    }
+    token_data_map = {'CCC': {'liquidity_usd': 15000.0}}
+    
+    class FakeBatch:
+        async def get_many(self, addresses, session=None):
+            return {address: dex_data_map[address] for address in addresses}
+    
+    async def run():
+        batch_analyzer = LiquidityAnalyzer()
+        batch_analyzer.dex_batch = FakeBatch()
+        batch = await batch_analyzer.analyze_many(list(dex_data_map), token_data_map)
+        await batch_analyzer.close()
+        
+        scalar_analyzer = LiquidityAnalyzer()
+        scalar = {
+            address: await scalar_analyzer.analyze(
+                address,
+                token_data_map.get(address),
+                dex_data=dex_data
+            )
+            for address, dex_data in dex_data_map.items()
+        }
+        return batch, scalar
+    
+    batch, scalar = asyncio.run(run())
+    
+    assert batch == scalar
+    assert batch['CCC'].total_liquidity_usd == pytest.approx(15000.0)
+
+
+def test_concurrent_analyze_calls_share_one_run():
+    """Concurrent analyses of one token run the pipeline once"""
+    import asyncio
+    
+    analyzer = HolderAnalyzer()
+    calls = []
+    
+    async def fake_fetch(token_address):
+        calls.append(token_address)
+        await asyncio.sleep(0)
+        return {'pairs': [{'info': {'holders': 300}}]}
+    
+    analyzer._fetch_dexscreener_data = fake_fetch
+    
+    async def run():
+        return await asyncio.gather(*(analyzer.analyze('AAA') for _ in range(3)))
+    
+    results = asyncio.run(run())
+    
+    assert calls == ['AAA']
+    assert results[0].total_holders == 300
+    assert all(result is results[0] for result in results)
+    assert analyzer._inflight == {}
+
+
+def test_rugcheck_concurrent_calls_share_one_request():
+    """Concurrent RugCheck lookups of one token hit the API once and are cached"""
+    import asyncio
+    
+    analyzer = RugCheckAnalyzer()
+    calls = []
+    
+    async def fake_fetch(token_address):
+        calls.append(token_address)
+        await asyncio.sleep(0)
+        return {'tokenMeta': {'mint': {}}}
+    
+    analyzer._fetch_with_retry = fake_fetch
+    
+    async def run():
+        results = await asyncio.gather(*(analyzer.analyze('AAA') for _ in range(3)))
+        return results, await analyzer.analyze('AAA')
+    
+    results, cached = asyncio.run(run())
+    
+    assert calls == ['AAA']
+    assert all(result is results[0] for result in results)
+    assert cached is results[0]
+    assert len(analyzer.cache) == 1
+
+
+def test_rugcheck_retry_honors_retry_after_and_skips_client_errors():
+    """429 is retried after Retry-After; other 4xx answers are not retried"""
+    import asyncio
+    import json
+    
+    class FakeResponse:
+        def __init__(self, status, headers=None, payload=None):
+            self.status = status
+            self.headers = headers or {}
+            self._payload = payload
+        
+        async def read(self):
+            return json.dumps(self._payload).encode()
+        
+        async def __aenter__(self):
+            return self
+        
+        async def __aexit__(self, *exc):
+            return False
+    
+    class FakeSession:
+        def __init__(self, responses):
+            self.responses = list(responses)
+            self.calls = 0
+        
+        def get(self, url, timeout=None):
+            self.calls += 1
+            return self.responses.pop(0)
+    
+    async def run(responses):
+        session = FakeSession(responses)
+        analyzer = RugCheckAnalyzer(session=session)
+        return await analyzer._fetch_with_retry('AAA'), session.calls
+    
+    data, calls = asyncio.run(run([
+        FakeResponse(429, {'Retry-After': '0'}),
+        FakeResponse(200, payload={'ok': True}),
+    ]))
+    assert data == {'ok': True}
+    assert calls == 2
+    
+    data, calls = asyncio.run(run([FakeResponse(400), FakeResponse(200, payload={'ok': True})]))
+    assert data == {}
+    assert calls == 1
+    
+    # An outage is an error, not an empty (and cacheable) report
+    with pytest.raises(ConnectionError):
+        asyncio.run(run([FakeResponse(503, {'Retry-After': '0'}) for _ in range(3)]))
+
+
+def test_analyzer_results_are_hashable():
+    """Frozen results hash by value, so equal results dedupe in sets and dict keys"""
+    import json
+    from dataclasses import asdict
+    from src.models.token_data import HolderResult, RugCheckResult
+    
+    fields = dict(
+        overall_score=7.5,
+        mint_authority_frozen=True,
+        freeze_authority_revoked=True,
+        top_10_holders_percent=20.0,
+        lp_locked=True,
+        lp_burned=False,
+        known_risks=['Low liquidity']
+    )
+    first = RugCheckResult(**fields)
+    second = RugCheckResult(**fields, raw_data={'risks': {}})
+    
+    assert first.known_risks == ('Low liquidity',)
+    assert first == second and hash(first) == hash(second)
+    assert len({first, second}) == 1
+    # A JSON round trip (as in the analyzer cache) yields an equal, hashable result
+    restored = RugCheckResult(**json.loads(json.dumps(asdict(first))))
+    assert restored == first and hash(restored) == hash(first)
+    assert isinstance(hash(HolderResult(total_holders=10, top_10_concentration=50.0)), int)
+
+
+def test_failed_results_cannot_be_modified():
+    """The shared failure results hold no mutable state a caller could corrupt"""
+    for analyzer_class in (RugCheckAnalyzer, LiquidityAnalyzer, HolderAnalyzer):
+        result = analyzer_class.FAILED_RESULT
+        assert result.raw_data is None
+    
+    with pytest.raises(AttributeError):
+        RugCheckAnalyzer.FAILED_RESULT.known_risks.append("corrupted")
+    assert RugCheckAnalyzer.FAILED_RESULT.known_risks == ("Analysis failed",)
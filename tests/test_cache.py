@@ -0,0 +1,94 @@
+"""Tests for cache utilities"""
+
+from src.utils.cache import AdaptiveTTL, TTLCache
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    """Cache never grows past maxsize and keeps recently used keys"""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache['a'] = 1
+    cache['b'] = 2
+    assert cache.get('a') == 1  # 'a' is now most recently used
+    cache['c'] = 3
+    
+    assert len(cache) == 2
+    assert 'b' not in cache
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+
+
+def test_ttl_cache_expires_entries():
+    """Entries older than ttl are treated as missing"""
+    cache = TTLCache(maxsize=10, ttl=0)
+    cache['a'] = 1
+    
+    assert cache.get('a') is None
+    assert cache.get('a', 'default') == 'default'
+    assert len(cache) == 0
+
+
+def test_adaptive_ttl_grows_while_steady_and_resets_on_change():
+    """Unchanged digests stretch the TTL up to the ceiling; a change resets it"""
+    ttl = AdaptiveTTL(initial=30, floor=10, ceiling=100, growth=2.0)
+    
+    assert ttl.observe('a', 1) == 30
+    assert ttl.observe('a', 1) == 60
+    assert ttl.observe('a', 1) == 100
+    assert ttl.observe('a', 2) == 10
+    assert ttl.observe('b', 1) == 30
+
+
+def test_analyzer_cache_policies(tmp_path):
+    """Stored results are reused; read-only never writes; write-only never reads; failures are not stored"""
+    import asyncio
+    from src.models.token_data import HolderResult
+    from src.utils.analyzer_cache import AnalyzerCache
+    
+    calls = []
+    
+    async def compute():
+        calls.append(1)
+        return HolderResult(total_holders=42, top_10_concentration=25.0, distribution_score=60.0)
+    
+    async def run(policy, key, **kwargs):
+        cache = AnalyzerCache(path=str(tmp_path / "cache.db"), policy=policy)
+        try:
+            return await cache.get_or_compute(key, compute, HolderResult, ttl=60, **kwargs)
+        finally:
+            cache.close()
+    
+    first = asyncio.run(run('enabled', 'a'))
+    second = asyncio.run(run('enabled', 'a'))
+    assert second == first
+    assert len(calls) == 1
+    
+    asyncio.run(run('read-only', 'b'))
+    asyncio.run(run('read-only', 'b'))
+    assert len(calls) == 3
+    
+    asyncio.run(run('enabled', 'c', cacheable=lambda result: False))
+    asyncio.run(run('enabled', 'c'))
+    assert len(calls) == 5
+    
+    asyncio.run(run('disabled', 'a'))
+    assert len(calls) == 6
+    
+    asyncio.run(run('write-only', 'd'))
+    asyncio.run(run('write-only', 'd'))
+    assert len(calls) == 8
+    asyncio.run(run('enabled', 'd'))
+    assert len(calls) == 8
+
+
+def test_ttl_cache_counts_hits_and_misses():
+    """get() outcomes are tallied for hit-rate reporting"""
+    cache = TTLCache(maxsize=10, ttl=60)
+    assert cache.hit_rate == 0.0
+    
+    cache['a'] = 1
+    cache.get('a')
+    cache.get('a')
+    cache.get('b')
+    
+    assert (cache.hits, cache.misses) == (2, 1)
+    assert cache.hit_rate == 2 / 3
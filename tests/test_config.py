@@ -0,0 +1,29 @@
+"""Tests for configuration lookups"""
+
+from src.core.config import Config
+
+
+def test_get_and_get_nested_read_the_indexed_config(tmp_path):
+    """Dotted and nested lookups return values, subtrees and defaults"""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(
+        "alerts:\n"
+        "  min_score: 80\n"
+        "  channel: null\n"
+        "scanners:\n"
+        "  pumpfun:\n"
+        "    enabled: true\n"
+    )
+    config = Config(str(config_file))
+    
+    assert config.get('alerts.min_score') == 80
+    assert config.get('alerts') == {'min_score': 80, 'channel': None}
+    assert config.get('alerts.missing', 5) == 5
+    assert config.get_nested('scanners', 'pumpfun', 'enabled') is True
+    assert config.get_nested('alerts', 'channel', default='x') == 'x'
+    assert config.get_nested('nope', 'deeper', default=7) == 7
+    
+    config_file.write_text("alerts:\n  min_score: 60\n")
+    config.reload()
+    assert config.get('alerts.min_score') == 60
+    assert config.get_nested('scanners', default={}) == {}
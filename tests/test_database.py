@@ -0,0 +1,31 @@
+"""Tests for database modules"""
+
+from sqlalchemy import func, select
+
+from src.database.db_manager import DatabaseManager
+from src.database.models import AnalysisModel
+
+
+def _analysis(address: str, score: float) -> dict:
+    """Minimal AnalysisResult.to_dict()-shaped payload"""
+    return {
+        'token': {'address': address, 'symbol': 'TEST'},
+        'scoring': {'score_combined': score},
+        'analyzed_at': '2026-01-01T00:00:00',
+        'errors': []
+    }
+
+
+def test_save_analysis_batch_stores_every_row(tmp_path):
+    """A batch lands in the analyses table, one row per analysis"""
+    db = DatabaseManager(f"sqlite:///{tmp_path / 'scanner.db'}")
+    db.save_analysis_batch([_analysis('A', 10.0), _analysis('B', 20.0)])
+    db.save_analysis(_analysis('C', 30.0))
+    
+    with db.get_session() as session:
+        assert session.scalar(select(func.count()).select_from(AnalysisModel)) == 3
+        stored = session.scalars(select(AnalysisModel).order_by(AnalysisModel.id)).all()
+    
+    assert [row.token_address for row in stored] == ['A', 'B', 'C']
+    assert stored[1].score_combined == 20.0
+    assert stored[1].data['token']['address'] == 'B'
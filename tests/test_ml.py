@@ -1,9 +1,130 @@
 """Tests for ML modules"""
 
+import joblib
+import numpy as np
 import pytest
 
+from src.ml.inference.predictor import FEATURE_ORDER, N_FEATURES, MLPredictor, feature_vector
+
 # TODO: Add ML tests
 
 def test_ml_placeholder():
     """Placeholder test"""
     assert True
+
+
+def test_feature_vector_follows_feature_order():
+    """Features land in FEATURE_ORDER positions; missing ones are zero"""
+    vector = feature_vector({'market_cap': 5.0, 'distribution_score': 7.0})
+    
+    assert vector.dtype == np.float32
+    assert vector.shape == (N_FEATURES,)
+    assert vector[FEATURE_ORDER.index('market_cap')] == 5.0
+    assert vector[FEATURE_ORDER.index('distribution_score')] == 7.0
+    assert vector.sum() == 12.0
+
+
+def test_predict_without_models(tmp_path):
+    """A missing pump predictor yields a zero score instead of failing"""
+    predictor = MLPredictor(models_dir=str(tmp_path))
+    
+    assert predictor.predict(np.zeros(N_FEATURES, dtype=np.float32)) == {'score': 0.0, 'confidence': 0.0}
+
+
+def test_predict_with_model(tmp_path):
+    """predict returns the pump predictor's positive-class probability"""
+    from sklearn.linear_model import LogisticRegression
+    
+    rng = np.random.default_rng(0)
+    X = rng.random((50, N_FEATURES), dtype=np.float32)
+    model = LogisticRegression().fit(X, X[:, 0] > 0.5)
+    joblib.dump(model, tmp_path / 'pump_predictor.pkl')
+    
+    predictor = MLPredictor(models_dir=str(tmp_path))
+    result = predictor.predict(X[0])
+    
+    expected = model.predict_proba(X[:1])[0, 1]
+    assert result['score'] == pytest.approx(expected)
+    assert result['confidence'] == pytest.approx(abs(2 * expected - 1))
+
+
+def test_predict_batch_matches_predict(tmp_path):
+    """Scoring rows together gives the same results as one at a time"""
+    from sklearn.linear_model import LogisticRegression
+    
+    rng = np.random.default_rng(1)
+    X = rng.random((20, N_FEATURES), dtype=np.float32)
+    joblib.dump(LogisticRegression().fit(X, X[:, 1] > 0.5), tmp_path / 'pump_predictor.pkl')
+    
+    predictor = MLPredictor(models_dir=str(tmp_path))
+    batch = predictor.predict_batch(X[:5])
+    
+    assert len(batch) == 5
+    for row, result in zip(X[:5], batch):
+        single = predictor.predict(row)
+        assert result['score'] == pytest.approx(single['score'])
+        assert result['confidence'] == pytest.approx(single['confidence'])
+
+
+def test_models_load_on_first_use(tmp_path):
+    """Nothing is loaded up front; each model is loaded when first needed"""
+    predictor = MLPredictor(models_dir=str(tmp_path))
+    assert predictor.models == {}
+    
+    predictor.warm_up()
+    assert list(predictor.models) == ['pump_predictor']
+    assert predictor._get('rug_detector') is None
+    assert 'rug_detector' in predictor.models
+
+
+class _ConstantModel:
+    """Stand-in classifier that predicts the same probability for every row"""
+    
+    def __init__(self, probability: float):
+        self.probability = probability
+    
+    def predict_proba(self, X):
+        return np.tile([1 - self.probability, self.probability], (len(X), 1))
+
+
+def test_uncertain_prediction_is_gated_out_of_score(tmp_path):
+    """A near coin-flip prediction has low confidence and does not move the combined score"""
+    from src.models.token_data import TokenData
+    from src.scoring.scoring_engine import ScoringEngine
+    
+    predictor = MLPredictor(models_dir=str(tmp_path))
+    predictor.models['pump_predictor'] = _ConstantModel(0.6)
+    result = predictor.predict(np.zeros(N_FEATURES, dtype=np.float32))
+    assert result['confidence'] == pytest.approx(0.2)
+    
+    token = TokenData(
+        address='So11111111111111111111111111111111111111112',
+        symbol='TEST',
+        name='Test Token',
+        liquidity_usd=50000,
+        market_cap=200000,
+        price_usd=0.01
+    )
+    scoring = ScoringEngine().calculate_score(
+        token,
+        ml_score=result['score'] * 100,
+        ml_confidence=result['confidence']
+    )
+    assert scoring.score_combined == pytest.approx(scoring.score_rules)
+    assert scoring.score_ml == 0.0
+
+
+def test_mock_models_are_not_used(tmp_path):
+    """Models marked as development mocks are treated as missing"""
+    from sklearn.linear_model import LogisticRegression
+    
+    rng = np.random.default_rng(2)
+    X = rng.random((20, N_FEATURES), dtype=np.float32)
+    model = LogisticRegression().fit(X, X[:, 0] > 0.5)
+    model.is_mock = True
+    joblib.dump(model, tmp_path / 'pump_predictor.pkl')
+    
+    predictor = MLPredictor(models_dir=str(tmp_path))
+    
+    assert predictor.predict(X[0]) == {'score': 0.0, 'confidence': 0.0}
+    assert predictor.models['pump_predictor'] is None
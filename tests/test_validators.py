@@ -0,0 +1,15 @@
+"""Tests for validation helpers"""
+
+from src.utils.validators import is_valid_address
+
+
+def test_is_valid_address():
+    """Test base58 Solana address validation"""
+    assert is_valid_address("So11111111111111111111111111111111111111112")
+    assert is_valid_address("EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v")
+    
+    # Too short, empty, or containing non-base58 characters (0, O, I, l)
+    assert not is_valid_address("So1111")
+    assert not is_valid_address("")
+    assert not is_valid_address("0" * 40)
+    assert not is_valid_address("EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDtOl")